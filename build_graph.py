@@ -68,35 +68,24 @@ def main(args: Optional[list] = None) -> int:
         return 1
 
     try:
-        # Phase 1: Parse input data
+        # Phases 1-3: Parse, normalize and build as one streaming pass,
+        # so parsed rows are never all held in memory at once
         logger.info("=" * 50)
-        logger.info("PHASE 1: Parsing input data")
+        logger.info("PHASE 1-3: Parsing, normalizing skills, building graph")
         logger.info("=" * 50)
 
         parser = DataParser(config)
-        data = list(parser.parse())  # Collect all rows
+        normalizer = SkillNormalizer()
+        builder = GraphBuilder(config)
 
-        if not data:
+        rows = normalizer.process_all(parser.parse())
+        graph = builder.build(rows, normalizer)
+
+        if parser.parsed_rows == 0:
             logger.error("No data parsed from input file")
             return 1
 
-        logger.info(f"Parsed {len(data):,} rows")
-
-        # Phase 2: Normalize skills
-        logger.info("=" * 50)
-        logger.info("PHASE 2: Normalizing skills")
-        logger.info("=" * 50)
-
-        normalizer = SkillNormalizer()
-        data = normalizer.process_all(data)
-
-        # Phase 3: Build graph
-        logger.info("=" * 50)
-        logger.info("PHASE 3: Building graph")
-        logger.info("=" * 50)
-
-        builder = GraphBuilder(config)
-        graph = builder.build(data, normalizer)
+        logger.info(f"Parsed {parser.parsed_rows:,} rows")
 
         # Phase 4: Sample (if requested)
         sampling_report = None
@@ -124,7 +113,8 @@ def main(args: Optional[list] = None) -> int:
 
         validator = Validator(config)
         report = validator.validate(
-            graph, normalizer, parser, output_files, sampling_report
+            graph, normalizer, parser, output_files, sampling_report,
+            exporter.row_counts
         )
         validator.write_report(report)
 
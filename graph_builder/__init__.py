@@ -9,7 +9,7 @@ __version__ = "2.0.0"
 __author__ = "Graph Builder Team"
 
 from .config import Config
-from .parser import DataParser
+from .parser import DataParser, JobRow
 from .normalizer import SkillNormalizer
 from .graph import GraphBuilder
 from .sampler import StatisticalSampler, PerformanceSampler
@@ -19,6 +19,7 @@ from .validator import Validator
 __all__ = [
     'Config',
     'DataParser',
+    'JobRow',
     'SkillNormalizer',
     'GraphBuilder',
     'StatisticalSampler',
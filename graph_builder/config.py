@@ -3,6 +3,7 @@ Configuration and CLI argument parsing.
 """
 
 import argparse
+import importlib.util
 import os
 from dataclasses import dataclass, field
 from typing import List, Optional
@@ -20,6 +21,9 @@ class Config:
     formats: List[str] = field(default_factory=lambda: ["csv", "graphml"])
     drop_thinking: bool = True
     include_aliases: bool = True
+    include_jd_text: bool = False
+    graphml_engine: str = "native"  # "native" or "lxml"
+    compress: str = "none"  # "none" or "zstd"
 
     # Edge filtering
     min_similarity: float = 0.0
@@ -34,6 +38,8 @@ class Config:
 
     # Processing options
     chunk_size: int = 10000
+    csv_engine: str = "pandas"  # "pandas" or "pyarrow"
+    parse_workers: int = 1  # 0 = one per CPU
     verbose: bool = False
 
     # Sampling options
@@ -100,17 +106,35 @@ Examples:
             default='csv,graphml',
             help='Output formats, comma-separated (default: csv,graphml)'
         )
+        parser.add_argument(
+            '--graphml_engine',
+            choices=['native', 'lxml'],
+            default='native',
+            help='GraphML writer: native or lxml (requires lxml) (default: native)'
+        )
+        parser.add_argument(
+            '--compress',
+            choices=['none', 'zstd'],
+            default='none',
+            help='Compress graph.graphml, nodes.csv and edges.csv (zstd requires zstandard) (default: none)'
+        )
         parser.add_argument(
             '--drop_thinking',
-            type=lambda x: x.lower() == 'true',
+            action=argparse.BooleanOptionalAction,
             default=True,
-            help='Omit "thinking" field from edges (default: true)'
+            help='Omit "thinking" field from edges (default: on)'
         )
         parser.add_argument(
             '--include_aliases',
-            type=lambda x: x.lower() == 'true',
+            action=argparse.BooleanOptionalAction,
             default=True,
-            help='Include skill aliases in output (default: true)'
+            help='Include skill aliases in output (default: on)'
+        )
+        parser.add_argument(
+            '--include_jd_text',
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help='Include the "hybrid_nco_jd" job description text on job nodes (default: off)'
         )
 
         # Edge filtering
@@ -156,6 +180,18 @@ Examples:
             default=10000,
             help='Rows per chunk for streaming (default: 10000)'
         )
+        parser.add_argument(
+            '--csv_engine',
+            choices=['pandas', 'pyarrow'],
+            default='pandas',
+            help='CSV reader: pandas or pyarrow (requires pyarrow) (default: pandas)'
+        )
+        parser.add_argument(
+            '--parse_workers',
+            type=int,
+            default=1,
+            help='Processes for parsing chunks, 0 = one per CPU (default: 1)'
+        )
         parser.add_argument(
             '--verbose', '-v',
             action='store_true',
@@ -190,9 +226,9 @@ Examples:
         )
         parser.add_argument(
             '--p_worstcase',
-            type=lambda x: x.lower() == 'true',
+            action=argparse.BooleanOptionalAction,
             default=True,
-            help='Use p=0.5 for worst-case variance (default: true)'
+            help='Use p=0.5 for worst-case variance (default: on)'
         )
         parser.add_argument(
             '--p_estimate',
@@ -202,9 +238,9 @@ Examples:
         )
         parser.add_argument(
             '--finite_correction',
-            type=lambda x: x.lower() == 'true',
+            action=argparse.BooleanOptionalAction,
             default=True,
-            help='Apply finite population correction (default: true)'
+            help='Apply finite population correction (default: on)'
         )
         parser.add_argument(
             '--min_per_category',
@@ -258,6 +294,9 @@ Examples:
             formats=[f.strip() for f in parsed.format.split(',')],
             drop_thinking=parsed.drop_thinking,
             include_aliases=parsed.include_aliases,
+            include_jd_text=parsed.include_jd_text,
+            graphml_engine=parsed.graphml_engine,
+            compress=parsed.compress,
             min_similarity=parsed.min_similarity,
             top_k_skills=parsed.top_k_skills,
             buckets=[b.strip() for b in parsed.buckets.split(',') if b.strip()],
@@ -265,6 +304,8 @@ Examples:
             category_column=parsed.category_column,
             job_id_column=parsed.job_id_column,
             chunk_size=parsed.chunk_size,
+            csv_engine=parsed.csv_engine,
+            parse_workers=parsed.parse_workers,
             verbose=parsed.verbose,
             subset=parsed.subset,
             subset_mode=parsed.subset_mode,
@@ -290,37 +331,44 @@ Examples:
 
         Returns list of error messages (empty if valid).
         """
-        errors = []
-
-        # Check input file exists
-        if not os.path.exists(self.input_path):
-            errors.append(f"Input file not found: {self.input_path}")
-
-        # Check input file extension
         ext = os.path.splitext(self.input_path)[1].lower()
-        if ext not in ['.csv', '.xlsx', '.xls']:
-            errors.append(f"Unsupported input format: {ext}. Use .csv, .xlsx, or .xls")
-
-        # Validate formats
         valid_formats = ['csv', 'graphml']
-        for fmt in self.formats:
-            if fmt not in valid_formats:
-                errors.append(f"Invalid format: {fmt}. Use: {valid_formats}")
-
-        # Validate ranges
-        if not (0.0 <= self.min_similarity <= 1.0):
-            errors.append(f"min_similarity must be 0.0-1.0, got {self.min_similarity}")
-
-        if self.top_k_skills < 0:
-            errors.append(f"top_k_skills must be >= 0, got {self.top_k_skills}")
-
-        if not (0.80 <= self.conf_level <= 0.999):
-            errors.append(f"conf_level must be 0.80-0.999, got {self.conf_level}")
-
-        if not (0.001 <= self.margin_error <= 0.5):
-            errors.append(f"margin_error must be 0.001-0.5, got {self.margin_error}")
 
-        return errors
+        # (failed, message) pairs, reported in this order
+        checks = [
+            # Input file
+            (not os.path.exists(self.input_path),
+             f"Input file not found: {self.input_path}"),
+            (ext not in ('.csv', '.xlsx', '.xls'),
+             f"Unsupported input format: {ext}. Use .csv, .xlsx, or .xls"),
+
+            # Output formats
+            *((fmt not in valid_formats,
+               f"Invalid format: {fmt}. Use: {valid_formats}")
+              for fmt in self.formats),
+
+            # Optional reader/writer dependencies must be importable
+            (self.csv_engine == 'pyarrow' and importlib.util.find_spec('pyarrow') is None,
+             "csv_engine 'pyarrow' requires the pyarrow package"),
+            (self.graphml_engine == 'lxml' and importlib.util.find_spec('lxml') is None,
+             "graphml_engine 'lxml' requires the lxml package"),
+            (self.compress == 'zstd' and importlib.util.find_spec('zstandard') is None,
+             "compress 'zstd' requires the zstandard package"),
+
+            # Ranges
+            (not (0.0 <= self.min_similarity <= 1.0),
+             f"min_similarity must be 0.0-1.0, got {self.min_similarity}"),
+            (self.parse_workers < 0,
+             f"parse_workers must be >= 0, got {self.parse_workers}"),
+            (self.top_k_skills < 0,
+             f"top_k_skills must be >= 0, got {self.top_k_skills}"),
+            (not (0.80 <= self.conf_level <= 0.999),
+             f"conf_level must be 0.80-0.999, got {self.conf_level}"),
+            (not (0.001 <= self.margin_error <= 0.5),
+             f"margin_error must be 0.001-0.5, got {self.margin_error}"),
+        ]
+
+        return [message for failed, message in checks if failed]
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for report.json."""
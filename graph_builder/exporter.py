@@ -10,20 +10,162 @@ Generates:
 """
 
 import os
+import csv
 import logging
-from typing import Dict, List, Any, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Iterator, Optional
 
-import pandas as pd
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import Config
 from .graph import GraphBuilder
 from .normalizer import SkillNormalizer
-from .parser import DataParser
-from .utils import escape_xml, format_bytes
+from .parser import DataParser, BAD_ROW_COLUMNS
+from .utils import escape_xml, format_bytes, strip_invalid_xml_chars
 
 
 logger = logging.getLogger('graph_builder')
 
+# Export files concurrently only when the graph is big enough to pay
+# for the thread pool
+PARALLEL_EXPORT_MIN_NODES = 50_000
+EXPORT_WORKERS = 4
+
+GRAPHML_NS = 'http://graphml.graphdrawing.org/xmlns'
+
+# Level for --compress zstd; output is still disk-bound well above this
+ZSTD_LEVEL = 3
+
+# GraphML fragments, pre-encoded for the bytes writer
+GRAPHML_FLUSH_BYTES = 4 << 20  # 4 MiB
+
+# Elements written between progress log lines
+GRAPHML_NODE_CHUNK = 50_000
+GRAPHML_EDGE_CHUNK = 100_000
+
+_B_NODE_OPEN = b'    <node id="'
+_B_NODE_CLOSE = b'    </node>\n'
+_B_EDGE_OPEN = b'    <edge source="'
+_B_EDGE_TARGET = b'" target="'
+_B_EDGE_CLOSE = b'    </edge>\n'
+_B_TAG_END = b'">\n'
+_B_DATA_CLOSE = b'</data>\n'
+
+# CSV floats: one C-level formatting pass instead of round() + str()
+_format_float = '{:.4f}'.format
+
+# bad_rows.csv when every row parsed
+_BAD_ROWS_HEADER = ','.join(BAD_ROW_COLUMNS) + '\n'
+
+# GraphML attribute schema: (key id, attr.type)
+GRAPHML_NODE_KEYS = (
+    # Common
+    ('label', 'string'),
+    ('kind', 'string'),
+
+    # Job-specific
+    ('job_title', 'string'),
+    ('company_name', 'string'),
+    ('posted_at', 'string'),
+    ('schedule_type', 'string'),
+    ('work_from_home', 'string'),
+    ('district', 'string'),
+    ('nco_code', 'string'),
+    ('group_name', 'string'),
+    ('assigned_occupation_group', 'string'),
+    ('hybrid_nco_jd', 'string'),
+    ('salary_mean_inr_month', 'double'),
+    ('salary_currency_unit', 'string'),
+    ('salary_source', 'string'),
+    ('skill_count', 'int'),
+    ('token_count', 'int'),
+    ('highest_similarity_spec', 'string'),
+    ('highest_similarity_score', 'double'),
+
+    # Skill-specific
+    ('canonical_key', 'string'),
+    ('aliases', 'string'),
+    ('job_count', 'int'),
+    ('max_similarity', 'double'),
+    ('avg_similarity', 'double'),
+)
+
+GRAPHML_EDGE_KEYS = (
+    ('rel', 'string'),
+    ('bucket', 'string'),
+    ('mapping_similarity', 'double'),
+    ('weight', 'double'),
+    ('thinking', 'string'),
+)
+
+
+def _format_string(value: Any) -> bytes:
+    return escape_xml(str(value)).encode('utf-8')
+
+
+def _format_bool(value: Any) -> bytes:
+    return b'true' if value else b'false'
+
+
+if orjson is not None:
+    # Shortest round-trip repr straight to bytes, formatted in C
+    _dumps = orjson.dumps
+
+    def _format_double(value: Any) -> bytes:
+        # orjson writes NaN/inf as null, which is not a GraphML double
+        if not math.isfinite(value):
+            return repr(value).encode('ascii')
+        value = round(value, 4)
+        try:
+            return _dumps(value)
+        except TypeError:
+            # Ints beyond 64 bits (orjson's limit)
+            return repr(value).encode('ascii')
+
+    def _format_int(value: Any) -> bytes:
+        try:
+            return _dumps(value)
+        except TypeError:
+            # Ints beyond 64 bits (orjson's limit)
+            return str(value).encode('ascii')
+else:
+    def _format_double(value: Any) -> bytes:
+        return repr(round(value, 4)).encode('ascii')
+
+    def _format_int(value: Any) -> bytes:
+        return str(value).encode('ascii')
+
+
+# GraphML value formatter per declared attr.type (returns UTF-8 bytes)
+GRAPHML_TYPE_FORMATTERS = {
+    'string': _format_string,
+    'double': _format_double,
+    'int': _format_int,
+    'long': _format_int,
+    'boolean': _format_bool,
+}
+
+
+def _data_fields(keys) -> Dict[str, tuple]:
+    """Map each key to its pre-encoded <data> opener and value formatter."""
+    return {
+        key: (
+            f'      <data key="{key}">'.encode('ascii'),
+            GRAPHML_TYPE_FORMATTERS[key_type]
+        )
+        for key, key_type in keys
+    }
+
+
+# Specialized over the fixed key schema, so serializers dispatch by
+# table lookup instead of per-value type checks
+_NODE_DATA_FIELDS = _data_fields(GRAPHML_NODE_KEYS)
+
 
 class Exporter:
     """Export graph data to various formats."""
@@ -31,6 +173,17 @@ class Exporter:
     def __init__(self, config: Config):
         self.config = config
 
+        # Data rows written per CSV output (by output name), for the report
+        self.row_counts: Dict[str, int] = {}
+
+        # Edge attributes written to GraphML (thinking is optional)
+        self._edge_keys = tuple(
+            (key, key_type) for key, key_type in GRAPHML_EDGE_KEYS
+            if not (key == 'thinking' and config.drop_thinking)
+        )
+        # (prefix, formatter) per edge key, aligned with _edge_rows()
+        self._edge_data_fields = tuple(_data_fields(self._edge_keys).values())
+
     def export(
         self,
         graph: GraphBuilder,
@@ -52,17 +205,33 @@ class Exporter:
 
         output_files = {}
 
-        # Export based on requested formats
+        # Export based on requested formats (name, writer, source)
+        tasks = []
         if 'csv' in self.config.formats:
-            output_files['nodes.csv'] = self._export_nodes_csv(graph)
-            output_files['edges.csv'] = self._export_edges_csv(graph)
+            tasks.append(('nodes.csv', self._export_nodes_csv, graph))
+            tasks.append(('edges.csv', self._export_edges_csv, graph))
 
         if 'graphml' in self.config.formats:
-            output_files['graph.graphml'] = self._export_graphml(graph)
+            tasks.append(('graph.graphml', self._export_graphml, graph))
 
         # Always export these
-        output_files['skill_dictionary.csv'] = self._export_skill_dictionary(normalizer)
-        output_files['bad_rows.csv'] = self._export_bad_rows(parser)
+        tasks.append(('skill_dictionary.csv', self._export_skill_dictionary, normalizer))
+        tasks.append(('bad_rows.csv', self._export_bad_rows, parser))
+
+        if len(graph.nodes) < PARALLEL_EXPORT_MIN_NODES:
+            for name, export_fn, source in tasks:
+                output_files[name] = export_fn(source)
+        else:
+            # Writers touch separate files and only read shared state;
+            # file writes (and zstd compression) release the GIL, while
+            # CSV rows and GraphML bytes are built under it
+            with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+                futures = {
+                    name: executor.submit(export_fn, source)
+                    for name, export_fn, source in tasks
+                }
+                for name, future in futures.items():
+                    output_files[name] = future.result()
 
         # Log output summary
         logger.info("Export complete:")
@@ -73,9 +242,23 @@ class Exporter:
 
         return output_files
 
+    def _output_path(self, name: str) -> str:
+        """Get the path for a graph output, with .zst when compressing."""
+        if self.config.compress == 'zstd':
+            name += '.zst'
+        return os.path.join(self.config.output_dir, name)
+
+    def _open_output(self, path: str, mode: str):
+        """Open a graph output file, through zstd when compressing."""
+        kwargs = {'encoding': 'utf-8', 'newline': ''} if 't' in mode else {}
+        if self.config.compress == 'zstd':
+            import zstandard
+            return zstandard.open(path, mode, cctx=_zstd_compressor(), **kwargs)
+        return open(path, mode, **kwargs)
+
     def _export_nodes_csv(self, graph: GraphBuilder) -> str:
         """Export nodes to CSV."""
-        path = os.path.join(self.config.output_dir, 'nodes.csv')
+        path = self._output_path('nodes.csv')
 
         # Define column order
         columns = [
@@ -91,21 +274,16 @@ class Exporter:
             # Category columns (job_count reused)
         ]
 
-        df = pd.DataFrame(list(graph.nodes.values()))
-
-        # Reorder columns, keeping only those that exist
-        existing_cols = [c for c in columns if c in df.columns]
-        extra_cols = [c for c in df.columns if c not in columns]
-        df = df[existing_cols + extra_cols]
-
-        df.to_csv(path, index=False)
-        logger.info(f"Exported {len(df):,} nodes to {path}")
+        cols = graph.node_columns(columns)
+        self._write_csv(cols, path)
+        self.row_counts['nodes.csv'] = len(graph.nodes)
+        logger.info(f"Exported {len(graph.nodes):,} nodes to {path}")
 
         return path
 
     def _export_edges_csv(self, graph: GraphBuilder) -> str:
         """Export edges to CSV."""
-        path = os.path.join(self.config.output_dir, 'edges.csv')
+        path = self._output_path('edges.csv')
 
         # Define column order
         columns = ['source', 'target', 'rel', 'bucket', 'mapping_similarity', 'weight']
@@ -113,163 +291,229 @@ class Exporter:
         if not self.config.drop_thinking:
             columns.append('thinking')
 
-        df = pd.DataFrame(graph.edges)
-
-        # Reorder columns
-        existing_cols = [c for c in columns if c in df.columns]
-        extra_cols = [c for c in df.columns if c not in columns]
-        df = df[existing_cols + extra_cols]
-
-        df.to_csv(path, index=False)
-        logger.info(f"Exported {len(df):,} edges to {path}")
+        cols = graph.edge_columns(columns)
+        self._write_csv(cols, path)
+        self.row_counts['edges.csv'] = graph.num_edges
+        logger.info(f"Exported {graph.num_edges:,} edges to {path}")
 
         return path
 
+    def _write_csv(self, cols: Dict[str, List[Any]], path: str):
+        """Write a column-oriented dict to CSV with the C csv writer."""
+        # Floats get the fixed precision; None becomes an empty field.
+        # Columns are formatted lazily, so zip() streams rows without a
+        # second full copy of the data
+        cells = [
+            (_format_float(v) if v.__class__ is float else v for v in values)
+            for values in cols.values()
+        ]
+        with self._open_output(path, 'wt') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(cols.keys())
+            writer.writerows(zip(*cells))
+
     def _export_graphml(self, graph: GraphBuilder) -> str:
         """Export graph to GraphML format."""
-        path = os.path.join(self.config.output_dir, 'graph.graphml')
+        path = self._output_path('graph.graphml')
 
         # Delete existing file to prevent corruption
         if os.path.exists(path):
             os.remove(path)
 
-        with open(path, 'w', encoding='utf-8') as f:
+        if self.config.graphml_engine == 'lxml':
+            self._write_graphml_lxml(graph, path)
+            logger.info(f"Exported GraphML to {path} (lxml)")
+            return path
+
+        compressor = None
+        if self.config.compress == 'zstd':
+            compressor = _zstd_compressor().compressobj()
+
+        with _RawBlockWriter(path, GRAPHML_FLUSH_BYTES, compressor) as f:
             # Write header
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+            f.write(
+                b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            )
 
             # Write key definitions
             self._write_graphml_keys(f)
 
             # Start graph
-            f.write('  <graph id="G" edgedefault="directed">\n')
+            f.write(b'  <graph id="G" edgedefault="directed">\n')
 
-            # Write nodes
-            node_count = 0
-            for node_id, node in graph.nodes.items():
-                f.write(self._node_to_graphml(node))
-                node_count += 1
+            # Escaped ids are shared by a node and all of its edges
+            xml_ids = _XmlIdCache()
 
-                if node_count % 50000 == 0:
-                    logger.debug(f"Written {node_count:,} nodes...")
+            # Write nodes (progress is logged per chunk, not per node)
+            write = f.write
+            node_to_graphml = self._node_to_graphml
+            node_count = 0
+            for chunk in _chunks(graph.nodes.values(), GRAPHML_NODE_CHUNK):
+                for node in chunk:
+                    write(node_to_graphml(node, xml_ids))
+                node_count += len(chunk)
+                logger.debug(f"Written {node_count:,} nodes...")
 
             # Write edges
+            edge_to_graphml = self._edge_to_graphml
             edge_count = 0
-            for edge in graph.edges:
-                f.write(self._edge_to_graphml(edge))
-                edge_count += 1
-
-                if edge_count % 100000 == 0:
-                    logger.debug(f"Written {edge_count:,} edges...")
+            for chunk in _chunks(self._edge_rows(graph), GRAPHML_EDGE_CHUNK):
+                for edge in chunk:
+                    write(edge_to_graphml(edge, xml_ids))
+                edge_count += len(chunk)
+                logger.debug(f"Written {edge_count:,} edges...")
 
             # Close graph
-            f.write('  </graph>\n')
-            f.write('</graphml>\n')
+            f.write(b'  </graph>\n</graphml>\n')
 
         logger.info(f"Exported GraphML to {path}")
         return path
 
-    def _write_graphml_keys(self, f):
-        """Write GraphML key definitions."""
-        # Node attributes
-        keys = [
-            # Common
-            ('label', 'node', 'string'),
-            ('kind', 'node', 'string'),
-
-            # Job-specific
-            ('job_title', 'node', 'string'),
-            ('company_name', 'node', 'string'),
-            ('posted_at', 'node', 'string'),
-            ('schedule_type', 'node', 'string'),
-            ('work_from_home', 'node', 'string'),
-            ('district', 'node', 'string'),
-            ('nco_code', 'node', 'string'),
-            ('group_name', 'node', 'string'),
-            ('assigned_occupation_group', 'node', 'string'),
-            ('salary_mean_inr_month', 'node', 'double'),
-            ('salary_currency_unit', 'node', 'string'),
-            ('salary_source', 'node', 'string'),
-            ('skill_count', 'node', 'int'),
-            ('token_count', 'node', 'int'),
-            ('highest_similarity_score', 'node', 'double'),
-
-            # Skill-specific
-            ('canonical_key', 'node', 'string'),
-            ('aliases', 'node', 'string'),
-            ('job_count', 'node', 'int'),
-            ('max_similarity', 'node', 'double'),
-            ('avg_similarity', 'node', 'double'),
-
-            # Edge attributes
-            ('rel', 'edge', 'string'),
-            ('bucket', 'edge', 'string'),
-            ('mapping_similarity', 'edge', 'double'),
-            ('weight', 'edge', 'double'),
-        ]
-
-        if not self.config.drop_thinking:
-            keys.append(('thinking', 'edge', 'string'))
+    def _write_graphml_lxml(self, graph: GraphBuilder, path: str):
+        """
+        Write GraphML through lxml's incremental writer.
 
-        for key_id, key_for, key_type in keys:
-            f.write(
-                f'  <key id="{key_id}" for="{key_for}" '
-                f'attr.name="{key_id}" attr.type="{key_type}"/>\n'
-            )
+        Escaping and UTF-8 encoding happen inside libxml2. Output is the
+        same document as the native writer, without indentation.
+        """
+        from lxml import etree
+
+        def tag(name: str) -> str:
+            return f'{{{GRAPHML_NS}}}{name}'
+
+        def text_formatter(key_type: str):
+            # Same per-type formatters as text; lxml does the escaping itself
+            if key_type == 'string':
+                return lambda value: strip_invalid_xml_chars(str(value))
+            fmt = GRAPHML_TYPE_FORMATTERS[key_type]
+            return lambda value: fmt(value).decode('ascii')
+
+        node_formatters = {
+            key: text_formatter(key_type) for key, key_type in GRAPHML_NODE_KEYS
+        }
+        edge_formatters = [
+            (key, text_formatter(key_type)) for key, key_type in self._edge_keys
+        ]
 
-    def _node_to_graphml(self, node: Dict[str, Any]) -> str:
-        """Convert a node to GraphML XML."""
-        node_id = escape_xml(node['id'])
-        xml = f'    <node id="{node_id}">\n'
+        def write_data(xf, key: str, text: str):
+            # Elements opened on the writer inherit the default namespace
+            with xf.element(tag('data'), key=key):
+                xf.write(text)
+
+        with self._open_output(path, 'wb') as out, \
+                etree.xmlfile(out, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element(tag('graphml'), nsmap={None: GRAPHML_NS}):
+                for key_id, key_for, key_type in self._graphml_key_defs():
+                    with xf.element(tag('key'), {
+                        'id': key_id, 'for': key_for,
+                        'attr.name': key_id, 'attr.type': key_type
+                    }):
+                        pass
+
+                with xf.element(tag('graph'), id='G', edgedefault='directed'):
+                    node_count = 0
+                    for node in graph.nodes.values():
+                        node_id = strip_invalid_xml_chars(str(node['id']))
+                        with xf.element(tag('node'), id=node_id):
+                            for key, value in node.items():
+                                fmt = node_formatters.get(key)
+                                if fmt is None:
+                                    continue
+                                if value is None or value == '':
+                                    continue
+                                write_data(xf, key, fmt(value))
+                        node_count += 1
+
+                        if node_count % 50000 == 0:
+                            xf.flush()
+                            logger.debug(f"Written {node_count:,} nodes...")
+
+                    edge_count = 0
+                    for edge in self._edge_rows(graph):
+                        with xf.element(
+                            tag('edge'),
+                            source=strip_invalid_xml_chars(str(edge[0])),
+                            target=strip_invalid_xml_chars(str(edge[1]))
+                        ):
+                            for (key, fmt), value in zip(edge_formatters, edge[2:]):
+                                if value is None or value == '':
+                                    continue
+                                write_data(xf, key, fmt(value))
+                        edge_count += 1
+
+                        if edge_count % 50000 == 0:
+                            xf.flush()
+                            logger.debug(f"Written {edge_count:,} edges...")
+
+    def _graphml_key_defs(self) -> List[tuple]:
+        """Get (id, for, attr.type) for every declared GraphML key."""
+        keys = [(key, 'node', key_type) for key, key_type in GRAPHML_NODE_KEYS]
+        keys += [(key, 'edge', key_type) for key, key_type in self._edge_keys]
+        return keys
 
-        # Write data elements for each attribute
+    def _write_graphml_keys(self, f):
+        """Write GraphML key definitions as a single block."""
+        block = ''.join(
+            f'  <key id="{key_id}" for="{key_for}" '
+            f'attr.name="{key_id}" attr.type="{key_type}"/>\n'
+            for key_id, key_for, key_type in self._graphml_key_defs()
+        )
+        f.write(block.encode('utf-8'))
+
+    def _node_to_graphml(
+        self,
+        node: Dict[str, Any],
+        xml_ids: '_XmlIdCache'
+    ) -> bytes:
+        """Convert a node to UTF-8 encoded GraphML XML."""
+        parts = [_B_NODE_OPEN, xml_ids[node['id']], _B_TAG_END]
+
+        # Write data elements for each declared attribute
+        fields = _NODE_DATA_FIELDS
         for key, value in node.items():
-            if key == 'id':
+            field = fields.get(key)
+            if field is None:
                 continue
             if value is None or value == '':
                 continue
 
-            # Format value based on type
-            if isinstance(value, float):
-                formatted = str(round(value, 4))
-            elif isinstance(value, bool):
-                formatted = 'true' if value else 'false'
-            else:
-                formatted = escape_xml(str(value))
-
-            xml += f'      <data key="{key}">{formatted}</data>\n'
-
-        xml += '    </node>\n'
-        return xml
-
-    def _edge_to_graphml(self, edge: Dict[str, Any]) -> str:
-        """Convert an edge to GraphML XML."""
-        source = escape_xml(edge['source'])
-        target = escape_xml(edge['target'])
-
-        xml = f'    <edge source="{source}" target="{target}">\n'
+            prefix, fmt = field
+            parts.append(prefix)
+            parts.append(fmt(value))
+            parts.append(_B_DATA_CLOSE)
+
+        parts.append(_B_NODE_CLOSE)
+        return b''.join(parts)
+
+    def _edge_rows(self, graph: GraphBuilder) -> Iterator[tuple]:
+        """Yield edges as (source, target, *values of the GraphML edge keys)."""
+        arrays = graph.edge_arrays()
+        return zip(
+            arrays['source'], arrays['target'],
+            *(arrays[key] for key, _ in self._edge_keys)
+        )
+
+    def _edge_to_graphml(self, edge: tuple, xml_ids: '_XmlIdCache') -> bytes:
+        """Convert an edge row from _edge_rows() to UTF-8 encoded GraphML XML."""
+        parts = [
+            _B_EDGE_OPEN, xml_ids[edge[0]],
+            _B_EDGE_TARGET, xml_ids[edge[1]],
+            _B_TAG_END
+        ]
 
-        # Write data elements
-        for key, value in edge.items():
-            if key in ('source', 'target'):
-                continue
+        # Write data elements (category edges have no skill attributes)
+        for (prefix, fmt), value in zip(self._edge_data_fields, edge[2:]):
             if value is None or value == '':
                 continue
 
-            # Skip thinking if configured
-            if key == 'thinking' and self.config.drop_thinking:
-                continue
-
-            # Format value
-            if isinstance(value, float):
-                formatted = str(round(value, 4))
-            else:
-                formatted = escape_xml(str(value))
-
-            xml += f'      <data key="{key}">{formatted}</data>\n'
+            parts.append(prefix)
+            parts.append(fmt(value))
+            parts.append(_B_DATA_CLOSE)
 
-        xml += '    </edge>\n'
-        return xml
+        parts.append(_B_EDGE_CLOSE)
+        return b''.join(parts)
 
     def _export_skill_dictionary(self, normalizer: SkillNormalizer) -> str:
         """Export skill dictionary."""
@@ -277,6 +521,7 @@ class Exporter:
 
         df = normalizer.export_dictionary()
         df.to_csv(path, index=False)
+        self.row_counts['skill_dictionary.csv'] = len(df)
 
         logger.info(f"Exported {len(df):,} skills to {path}")
         return path
@@ -285,8 +530,94 @@ class Exporter:
         """Export bad rows."""
         path = os.path.join(self.config.output_dir, 'bad_rows.csv')
 
+        # Usual case: nothing failed, so skip pandas and write the header
+        if not parser.bad_rows:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(_BAD_ROWS_HEADER)
+            self.row_counts['bad_rows.csv'] = 0
+            logger.info(f"Exported 0 bad rows to {path}")
+            return path
+
         df = parser.get_bad_rows_df()
         df.to_csv(path, index=False)
+        self.row_counts['bad_rows.csv'] = len(df)
 
         logger.info(f"Exported {len(df):,} bad rows to {path}")
         return path
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to ``size`` items."""
+    it = iter(iterable)
+    chunk = list(islice(it, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, size))
+
+
+def _zstd_compressor():
+    """Create a multi-threaded zstd compressor (requires zstandard)."""
+    import zstandard
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+
+
+class _XmlIdCache(dict):
+    """Node id -> escaped UTF-8 bytes, computed on first access."""
+
+    def __missing__(self, node_id: str) -> bytes:
+        escaped = self[node_id] = escape_xml(node_id).encode('utf-8')
+        return escaped
+
+
+class _RawBlockWriter:
+    """
+    Coalesce small byte strings into large blocks written to a raw fd.
+
+    Bypasses Python's buffered file objects: each block goes out via
+    os.write, so a multi-GB export costs one syscall per block. An
+    optional compressor (``compress``/``flush`` interface, e.g. a zstd
+    compressobj) is applied block by block.
+    """
+
+    def __init__(self, path: str, block_size: int, compressor: Any = None):
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._block_size = block_size
+        self._compressor = compressor
+        self._buf: List[bytes] = []
+        self._size = 0
+
+    def write(self, data: bytes):
+        self._buf.append(data)
+        self._size += len(data)
+        if self._size >= self._block_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buf:
+            return
+        block = b''.join(self._buf)
+        self._buf.clear()
+        self._size = 0
+        if self._compressor is not None:
+            block = self._compressor.compress(block)
+        self._write_all(block)
+
+    def _write_all(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def close(self):
+        try:
+            self.flush()
+            if self._compressor is not None:
+                self._write_all(self._compressor.flush())
+        finally:
+            os.close(self._fd)
+
+    def __enter__(self) -> '_RawBlockWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
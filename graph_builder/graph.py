@@ -8,17 +8,58 @@ Builds the knowledge graph with:
 - Edges: Job→Skill, Job→Category
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Set, Optional
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from itertools import compress, repeat
+from typing import Collection, Dict, Iterable, Iterator, List, Any, Sequence, Set, Optional, Tuple
 
 from .utils import slugify, safe_float
 from .normalizer import SkillNormalizer
+from .parser import JobRow
 from .config import Config
 
 
 logger = logging.getLogger('graph_builder')
 
+# Extra candidates selected beyond top_k_skills, so skills dropped by the
+# filters or as duplicates rarely force a full sort
+TOP_K_BUFFER = 8
+
+
+# Edge relation codes stored in edge_rel; REL_NAMES[code] is the exported name
+REL_REQUIRES_SKILL = 0
+REL_IN_CATEGORY = 1
+REL_NAMES = ('REQUIRES_SKILL', 'IN_CATEGORY')
+
+# Fixed per-kind schemas for the DataFrame views
+JOB_COLUMNS = (
+    'id', 'label', 'kind',
+    'job_title', 'company_name', 'posted_at',
+    'schedule_type', 'work_from_home', 'district',
+    'nco_code', 'group_name', 'assigned_occupation_group',
+    'hybrid_nco_jd', 'token_count', 'highest_similarity_spec',
+    'highest_similarity_score',
+    'salary_mean_inr_month', 'salary_currency_unit', 'salary_source',
+    'skill_count',
+)
+SKILL_COLUMNS = (
+    'id', 'label', 'kind',
+    'canonical_key', 'aliases', 'job_count', 'max_similarity', 'avg_similarity',
+)
+CATEGORY_COLUMNS = ('id', 'label', 'kind', 'nco_code', 'job_count')
+NODE_COLUMNS = {'job': JOB_COLUMNS, 'skill': SKILL_COLUMNS, 'category': CATEGORY_COLUMNS}
+
+EDGE_COLUMNS = ('source', 'target', 'rel', 'bucket', 'mapping_similarity', 'weight', 'thinking')
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ('kind', 'rel', 'bucket')
+
+
+def _similarity_key(skill_entry: Dict) -> Any:
+    return skill_entry.get('mapping_similarity', 0)
+
 
 class GraphBuilder:
     """
@@ -39,48 +80,83 @@ class GraphBuilder:
 
         # Graph storage
         self.nodes: Dict[str, Dict[str, Any]] = {}
-        self.edges: List[Dict[str, Any]] = []
+
+        # Edges are stored column-wise: edge i is (edge_source[i],
+        # edge_target[i], edge_rel[i], ...). Category edges carry None
+        # for bucket, similarity and thinking. Relations are int8 codes
+        # (see REL_NAMES) and bucket strings are shared per value.
+        # Similarities are stored unrounded; writers round to 4 places.
+        # Rows arrive as a stream of unknown length, so the columns (and
+        # self.nodes) grow by amortized O(1) appends rather than pre-sizing.
+        self.edge_source: List[str] = []
+        self.edge_target: List[str] = []
+        self.edge_rel = array('b')
+        self.edge_bucket: List[Optional[str]] = []
+        self.edge_similarity: List[Optional[float]] = []
+        self.edge_thinking: List[Optional[str]] = []
+        self._bucket_values: Dict[str, str] = {}
+
+        # (edge position, job_id, row) of jobs whose skill edges wait for
+        # the complete skill dictionary; see _create_skill_edges
+        self._deferred_skill_rows: List[Tuple[int, str, JobRow]] = []
+
+        # job_edge_index() result and the edge count it was built at
+        self._job_edge_index: Optional[Tuple[int, Dict[str, List[int]], Dict[str, str]]] = None
 
         # Tracking
         self.categories_seen: Set[str] = set()
         self.jobs_with_skills: Set[str] = set()
         self.jobs_with_category: Set[str] = set()
 
+        # Node counts by kind, kept as nodes are added
+        self.n_jobs = 0
+        self.n_skills = 0
+        self.n_categories = 0
+
         # Stats
         self.skill_edges_created = 0
         self.category_edges_created = 0
         self.skills_filtered_similarity = 0
         self.skills_filtered_bucket = 0
 
-    def build(self, data: List[Dict], normalizer: SkillNormalizer) -> 'GraphBuilder':
+    def build(self, data: Iterable[JobRow], normalizer: SkillNormalizer) -> 'GraphBuilder':
         """
         Build the complete graph from parsed data.
 
+        Rows are consumed one at a time, so ``data`` may be a generator
+        (e.g. ``normalizer.process_all(parser.parse())``).
+
         Args:
-            data: List of parsed row dicts
-            normalizer: SkillNormalizer with populated dictionary
+            data: Iterable of parsed JobRows
+            normalizer: SkillNormalizer that has registered each row's
+                skills by the time the row is yielded
 
         Returns:
             self (for chaining)
         """
         logger.info("Building graph...")
 
+        row_count = 0
         for row in data:
             self._process_row(row, normalizer)
+            row_count += 1
+
+        if self._deferred_skill_rows:
+            self._create_deferred_skill_edges(normalizer)
+
+        logger.info(f"Processed {row_count:,} rows into graph")
 
         # Add skill nodes from normalizer dictionary
         self._add_skill_nodes(normalizer)
 
-        # Update category job counts
-        self._update_category_counts()
-
         logger.info(
-            f"Graph built: {len(self.nodes):,} nodes, {len(self.edges):,} edges"
+            f"Graph built: {len(self.nodes):,} nodes, {self.num_edges:,} edges"
         )
+        kind_counts = self._count_kinds()
         logger.info(
-            f"  Jobs: {self._count_by_kind('job'):,}, "
-            f"Skills: {self._count_by_kind('skill'):,}, "
-            f"Categories: {self._count_by_kind('category'):,}"
+            f"  Jobs: {kind_counts['job']:,}, "
+            f"Skills: {kind_counts['skill']:,}, "
+            f"Categories: {kind_counts['category']:,}"
         )
         logger.info(
             f"  Job→Skill edges: {self.skill_edges_created:,}, "
@@ -95,70 +171,69 @@ class GraphBuilder:
 
         return self
 
-    def _process_row(self, row: Dict, normalizer: SkillNormalizer):
+    def _process_row(self, row: JobRow, normalizer: SkillNormalizer):
         """Process a single job row."""
         # Create job node
-        job_id = f"job:{row['job_id']}"
+        job_id = f"job:{row.job_id}"
+        if job_id not in self.nodes:
+            self.n_jobs += 1
         self.nodes[job_id] = self._create_job_node(row)
 
         # Create/reference category node and edge
         category_id = self._ensure_category(row)
         if category_id:
-            self.edges.append({
-                'source': job_id,
-                'target': category_id,
-                'rel': 'IN_CATEGORY'
-            })
+            self.add_edge(job_id, category_id, REL_IN_CATEGORY)
+            self.nodes[category_id]['job_count'] += 1
             self.jobs_with_category.add(job_id)
             self.category_edges_created += 1
 
         # Create skill edges
         self._create_skill_edges(job_id, row, normalizer)
 
-    def _create_job_node(self, row: Dict) -> Dict[str, Any]:
+    def _create_job_node(self, row: JobRow) -> Dict[str, Any]:
         """Create a job node with full metadata."""
         return {
-            'id': f"job:{row['job_id']}",
-            'label': row['job_title'] or 'Untitled Job',
+            'id': f"job:{row.job_id}",
+            'label': row.job_title or 'Untitled Job',
             'kind': 'job',
 
             # Core metadata
-            'job_title': row['job_title'],
-            'company_name': row['company_name'],
-            'posted_at': row['posted_at'],
+            'job_title': row.job_title,
+            'company_name': row.company_name,
+            'posted_at': row.posted_at,
 
             # Work arrangement
-            'schedule_type': row['schedule_type'],
-            'work_from_home': row['work_from_home'],
-            'district': row['district'],
+            'schedule_type': row.schedule_type,
+            'work_from_home': row.work_from_home,
+            'district': row.district,
 
             # Classification
-            'nco_code': row['nco_code'],
-            'group_name': row['group_name'],
-            'assigned_occupation_group': row['assigned_occupation_group'],
+            'nco_code': row.nco_code,
+            'group_name': row.group_name,
+            'assigned_occupation_group': row.assigned_occupation_group,
 
             # Technical
-            'hybrid_nco_jd': row.get('hybrid_nco_jd', ''),
-            'token_count': row.get('token_count', 0),
-            'highest_similarity_spec': row.get('highest_similarity_spec', ''),
-            'highest_similarity_score': row.get('highest_similarity_score', 0),
+            'hybrid_nco_jd': row.hybrid_nco_jd if self.config.include_jd_text else '',
+            'token_count': row.token_count,
+            'highest_similarity_spec': row.highest_similarity_spec,
+            'highest_similarity_score': row.highest_similarity_score,
 
             # Salary
-            'salary_mean_inr_month': row['salary_mean'],
-            'salary_currency_unit': row['salary_currency'],
-            'salary_source': row['salary_source'],
+            'salary_mean_inr_month': row.salary_mean,
+            'salary_currency_unit': row.salary_currency,
+            'salary_source': row.salary_source,
 
             # Computed
-            'skill_count': len(row.get('skills', []))
+            'skill_count': len(row.skills)
         }
 
-    def _ensure_category(self, row: Dict) -> Optional[str]:
+    def _ensure_category(self, row: JobRow) -> Optional[str]:
         """
         Ensure category node exists and return its ID.
 
         Uses assigned_occupation_group primarily, falls back to group_name.
         """
-        cat_name = row.get('assigned_occupation_group') or row.get('group_name')
+        cat_name = row.assigned_occupation_group or row.group_name
         if not cat_name or not cat_name.strip():
             return None
 
@@ -171,158 +246,227 @@ class GraphBuilder:
                 'id': cat_id,
                 'label': cat_name,
                 'kind': 'category',
-                'nco_code': row.get('nco_code', ''),
-                'job_count': 0  # Will be updated later
+                'nco_code': row.nco_code,
+                'job_count': 0  # Incremented per IN_CATEGORY edge
             }
             self.categories_seen.add(cat_id)
+            self.n_categories += 1
 
         return cat_id
 
-    def _create_skill_edges(self, job_id: str, row: Dict, normalizer: SkillNormalizer):
-        """Create edges from job to skills."""
-        skills = row.get('skills', [])
+    def _create_skill_edges(
+        self,
+        job_id: str,
+        row: JobRow,
+        normalizer: SkillNormalizer,
+        defer: bool = True
+    ):
+        """
+        Create edges from job to skills.
+
+        While rows are still streaming in, a label that misses may match
+        a skill a later row registers. The job's skill edges are then
+        rolled back and deferred until the dictionary is complete, so
+        they resolve as if every row had been registered first.
+        """
+        skills = row.skills
         if not skills:
             return
 
-        # Sort by similarity descending for top_k filtering
-        skills_sorted = sorted(
-            skills,
-            key=lambda s: s.get('mapping_similarity', 0),
-            reverse=True
-        )
+        first_edge = self.num_edges
+        filtered = (self.skills_filtered_bucket, self.skills_filtered_similarity)
 
         skills_added: Set[str] = set()
+        labels_seen: Set[str] = set()
         edges_created = 0
 
-        for skill_entry in skills_sorted:
+        buckets = self.config.buckets
+        min_similarity = self.config.min_similarity
+        top_k = self.config.top_k_skills
+
+        for skill_entry in self._ranked_skills(skills):
+            bucket = skill_entry.get('bucket', '')
+
             # Apply bucket filter
-            if self.config.buckets:
-                bucket = skill_entry.get('bucket', '')
-                if bucket not in self.config.buckets:
-                    self.skills_filtered_bucket += 1
-                    continue
+            if buckets and bucket not in buckets:
+                self.skills_filtered_bucket += 1
+                continue
 
-            # Apply similarity threshold
-            similarity = safe_float(skill_entry.get('mapping_similarity', 0))
-            if similarity < self.config.min_similarity:
+            # Apply similarity threshold; the parser already stores floats,
+            # so safe_float is only needed for other (or NaN) values
+            similarity = skill_entry.get('mapping_similarity', 0)
+            if similarity.__class__ is not float or similarity != similarity:
+                similarity = safe_float(similarity)
+            if similarity < min_similarity:
                 self.skills_filtered_similarity += 1
                 continue
 
+            # A repeated raw label resolves to the same skill (or to none),
+            # so it can only be a duplicate; skip the lookup. Checked after
+            # the filters so the filter counts are unchanged.
+            label = skill_entry.get('skill', '')
+            if label in labels_seen:
+                continue
+            labels_seen.add(label)
+
             # Get canonical skill ID
-            skill_id = normalizer.get_skill_id(skill_entry.get('skill', ''))
+            skill_id = normalizer.get_skill_id(label)
             if not skill_id:
+                if defer and normalizer.may_resolve_later(label):
+                    self._truncate_edges(first_edge)
+                    self.skills_filtered_bucket, self.skills_filtered_similarity = filtered
+                    self._deferred_skill_rows.append((first_edge, job_id, row))
+                    return
                 continue
 
             # Skip duplicates within same job
             if skill_id in skills_added:
                 continue
 
-            # Create edge
-            edge = {
-                'source': job_id,
-                'target': skill_id,
-                'rel': 'REQUIRES_SKILL',
-                'bucket': skill_entry.get('bucket', ''),
-                'mapping_similarity': round(similarity, 4),
-                'weight': round(similarity, 4)  # For Gephi
-            }
-
             # Optionally include thinking
+            thinking = None
             if not self.config.drop_thinking:
-                edge['thinking'] = skill_entry.get('thinking', '')
-
-            self.edges.append(edge)
+                thinking = skill_entry.get('thinking', '')
+
+            # Create edge (exported weight mirrors mapping_similarity for Gephi)
+            self.add_edge(
+                job_id, skill_id, REL_REQUIRES_SKILL,
+                bucket=bucket,
+                similarity=similarity,
+                thinking=thinking
+            )
             skills_added.add(skill_id)
             edges_created += 1
 
             # Apply top_k limit
-            if self.config.top_k_skills > 0 and edges_created >= self.config.top_k_skills:
+            if top_k > 0 and edges_created >= top_k:
                 break
 
         if edges_created > 0:
             self.jobs_with_skills.add(job_id)
             self.skill_edges_created += edges_created
 
+    def _create_deferred_skill_edges(self, normalizer: SkillNormalizer):
+        """
+        Create the deferred jobs' skill edges, now that the dictionary is
+        complete, and move them to where they would have been created.
+        """
+        deferred = self._deferred_skill_rows
+        self._deferred_skill_rows = []
+
+        n_edges = self.num_edges
+        order: List[int] = []
+        prev = 0
+        for position, job_id, row in deferred:
+            start = self.num_edges
+            self._create_skill_edges(job_id, row, normalizer, defer=False)
+            order.extend(range(prev, position))
+            order.extend(range(start, self.num_edges))
+            prev = position
+        order.extend(range(prev, n_edges))
+
+        self.edge_source = [self.edge_source[i] for i in order]
+        self.edge_target = [self.edge_target[i] for i in order]
+        self.edge_rel = array('b', map(self.edge_rel.__getitem__, order))
+        self.edge_bucket = [self.edge_bucket[i] for i in order]
+        self.edge_similarity = [self.edge_similarity[i] for i in order]
+        self.edge_thinking = [self.edge_thinking[i] for i in order]
+
+    def _ranked_skills(self, skills: List[Dict]) -> Iterator[Dict]:
+        """
+        Yield skills by similarity descending for top_k filtering.
+
+        With a top_k limit only the leading candidates are selected
+        (O(n log k)); the full sort runs only if they run out before
+        top_k edges are made. Ties keep input order either way.
+        """
+        top_k = self.config.top_k_skills
+        n = top_k + TOP_K_BUFFER
+        if top_k > 0 and len(skills) > n:
+            yield from heapq.nlargest(n, skills, key=_similarity_key)
+            yield from sorted(skills, key=_similarity_key, reverse=True)[n:]
+        else:
+            yield from sorted(skills, key=_similarity_key, reverse=True)
+
     def _add_skill_nodes(self, normalizer: SkillNormalizer):
         """Add skill nodes from the normalizer dictionary."""
         # Build set of skills with edges first (O(m) instead of O(n*m))
         logger.info("Indexing skill edges...")
-        skills_with_edges = {
-            e['target'] for e in self.edges
-            if e['rel'] == 'REQUIRES_SKILL'
-        }
+        is_skill_edge = [rel == REL_REQUIRES_SKILL for rel in self.edge_rel]
+        skills_with_edges = set(compress(self.edge_target, is_skill_edge))
         logger.info(f"Found {len(skills_with_edges):,} unique skills with edges")
 
+        # Counters are aligned with dictionary order; tolist() gives
+        # plain Python ints for the node attributes
+        counters = normalizer.skill_counters()
+        if self.config.include_aliases:
+            aliases = normalizer.joined_aliases()
+        else:
+            aliases = repeat('')
+        skills = zip(
+            normalizer.skill_dictionary.items(),
+            aliases,
+            counters['occurrence_count'].tolist(),
+            counters['max_similarity'],
+            counters['avg_similarity']
+        )
+
         # Now iterate through dictionary and check set membership (O(1))
-        for key, entry in normalizer.skill_dictionary.items():
+        for (key, entry), joined_aliases, job_count, max_sim, avg_sim in skills:
             skill_id = f"skill:{key}"
 
             # Only add skills that have edges - O(1) set lookup
             if skill_id not in skills_with_edges:
                 continue
 
-            avg_sim = (
-                entry['sum_similarity'] / entry['occurrence_count']
-                if entry['occurrence_count'] > 0 else 0
-            )
-
             self.nodes[skill_id] = {
                 'id': skill_id,
-                'label': entry['canonical_label'],
+                'label': entry.canonical_label,
                 'kind': 'skill',
                 'canonical_key': key,
-                'aliases': '|'.join(sorted(entry['aliases'])) if self.config.include_aliases else '',
-                'job_count': entry['occurrence_count'],
-                'max_similarity': round(entry['max_similarity'], 4),
-                'avg_similarity': round(avg_sim, 4)
+                'aliases': joined_aliases,
+                'job_count': job_count,
+                'max_similarity': max_sim,
+                'avg_similarity': avg_sim
             }
+            self.n_skills += 1
 
-    def _update_category_counts(self):
-        """Update job counts for category nodes."""
-        category_counts = defaultdict(int)
-
-        for edge in self.edges:
-            if edge['rel'] == 'IN_CATEGORY':
-                category_counts[edge['target']] += 1
-
-        for cat_id, count in category_counts.items():
-            if cat_id in self.nodes:
-                self.nodes[cat_id]['job_count'] = count
-
-    def _count_by_kind(self, kind: str) -> int:
-        """Count nodes by kind."""
-        return sum(1 for n in self.nodes.values() if n.get('kind') == kind)
+    def _count_kinds(self) -> Counter:
+        """Node counts by kind, from the running counters."""
+        return Counter(
+            job=self.n_jobs, skill=self.n_skills, category=self.n_categories
+        )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get graph statistics."""
-        jobs = [n for n in self.nodes.values() if n['kind'] == 'job']
-        skills = [n for n in self.nodes.values() if n['kind'] == 'skill']
-        categories = [n for n in self.nodes.values() if n['kind'] == 'category']
+        kind_counts = self._count_kinds()
+        jobs = kind_counts['job']
 
-        job_skill_edges = [e for e in self.edges if e['rel'] == 'REQUIRES_SKILL']
-        job_cat_edges = [e for e in self.edges if e['rel'] == 'IN_CATEGORY']
+        # Relation codes are counted in C over the int8 column
+        job_skill_edges = self.edge_rel.count(REL_REQUIRES_SKILL)
+        job_cat_edges = self.edge_rel.count(REL_IN_CATEGORY)
 
         jobs_with_skills_pct = (
-            len(self.jobs_with_skills) / len(jobs) * 100
+            len(self.jobs_with_skills) / jobs * 100
             if jobs else 0
         )
 
         avg_skills = (
-            len(job_skill_edges) / len(jobs)
+            job_skill_edges / jobs
             if jobs else 0
         )
 
         return {
             'nodes_total': len(self.nodes),
             'nodes_by_kind': {
-                'job': len(jobs),
-                'skill': len(skills),
-                'category': len(categories)
+                'job': jobs,
+                'skill': kind_counts['skill'],
+                'category': kind_counts['category']
             },
-            'edges_total': len(self.edges),
+            'edges_total': self.num_edges,
             'edges_by_rel': {
-                'REQUIRES_SKILL': len(job_skill_edges),
-                'IN_CATEGORY': len(job_cat_edges)
+                'REQUIRES_SKILL': job_skill_edges,
+                'IN_CATEGORY': job_cat_edges
             },
             'jobs_with_skills_count': len(self.jobs_with_skills),
             'jobs_with_skills_pct': round(jobs_with_skills_pct, 2),
@@ -332,12 +476,194 @@ class GraphBuilder:
             'skills_filtered_by_bucket': self.skills_filtered_bucket
         }
 
-    def get_nodes_df(self) -> 'pd.DataFrame':
-        """Get nodes as pandas DataFrame."""
+    def node_columns(self, columns: Sequence[str] = ()) -> Dict[str, List[Any]]:
+        """
+        Get nodes in column-oriented (SoA) form.
+
+        See ``records_to_columns`` for column ordering.
+        """
+        return records_to_columns(self.nodes.values(), columns)
+
+    def edge_arrays(self) -> Dict[str, List[Any]]:
+        """
+        Get every edge column, keyed as in EDGE_COLUMNS.
+
+        Apart from 'rel', which is decoded to names on each call, the
+        lists are the graph's own storage (weight shares the similarity
+        list); treat them as read-only.
+        """
+        return {
+            'source': self.edge_source,
+            'target': self.edge_target,
+            'rel': list(map(REL_NAMES.__getitem__, self.edge_rel)),
+            'bucket': self.edge_bucket,
+            'mapping_similarity': self.edge_similarity,
+            'weight': self.edge_similarity,
+            'thinking': self.edge_thinking,
+        }
+
+    def edge_columns(self, columns: Sequence[str] = ()) -> Dict[str, List[Any]]:
+        """
+        Get edges in column-oriented (SoA) form.
+
+        Same ordering as ``records_to_columns``: known ``columns`` first,
+        then the remaining EDGE_COLUMNS; columns with no value on any
+        edge are dropped.
+        """
+        arrays = self.edge_arrays()
+
+        # Skill attributes exist only when there are skill edges
+        present = {'source', 'target', 'rel'}
+        if REL_REQUIRES_SKILL in self.edge_rel:
+            present.update(('bucket', 'mapping_similarity', 'weight'))
+            if not self.config.drop_thinking:
+                present.add('thinking')
+
+        order = [c for c in columns if c in present]
+        order += [c for c in EDGE_COLUMNS if c in present and c not in columns]
+        return {c: arrays[c] for c in order}
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges in the graph."""
+        return len(self.edge_source)
+
+    def add_edge(
+        self,
+        source: str,
+        target: str,
+        rel: int,
+        bucket: Optional[str] = None,
+        similarity: Optional[float] = None,
+        thinking: Optional[str] = None
+    ):
+        """Append one edge to the edge columns (rel is a REL_* code)."""
+        if bucket is not None:
+            bucket = self._bucket_values.setdefault(bucket, bucket)
+
+        self.edge_source.append(source)
+        self.edge_target.append(target)
+        self.edge_rel.append(rel)
+        self.edge_bucket.append(bucket)
+        self.edge_similarity.append(similarity)
+        self.edge_thinking.append(thinking)
+
+    def _truncate_edges(self, n: int):
+        """Drop every edge from index ``n`` on."""
+        for column in (
+            self.edge_source, self.edge_target, self.edge_rel,
+            self.edge_bucket, self.edge_similarity, self.edge_thinking,
+        ):
+            del column[n:]
+
+    def take_edges(self, other: 'GraphBuilder', indices: Sequence[int]):
+        """Append the edges of ``other`` at ``indices`` to this graph."""
+        for mine, theirs in (
+            (self.edge_source, other.edge_source),
+            (self.edge_target, other.edge_target),
+            (self.edge_rel, other.edge_rel),
+            (self.edge_bucket, other.edge_bucket),
+            (self.edge_similarity, other.edge_similarity),
+            (self.edge_thinking, other.edge_thinking),
+        ):
+            mine.extend(map(theirs.__getitem__, indices))
+
+    def job_edge_index(self) -> Tuple[Dict[str, List[int]], Dict[str, str]]:
+        """
+        Index the edges by job, in one pass.
+
+        Built on first use and rebuilt only if edges were added since,
+        so samplers can share it instead of rescanning every edge.
+
+        Returns:
+            (job_out_edges, job_category): the edge indices of each
+            job's REQUIRES_SKILL and IN_CATEGORY edges in edge order,
+            and each job's category ID (its last IN_CATEGORY edge)
+        """
+        if self._job_edge_index is None or self._job_edge_index[0] != self.num_edges:
+            job_out_edges: Dict[str, List[int]] = defaultdict(list)
+            job_category: Dict[str, str] = {}
+            edges = zip(self.edge_source, self.edge_target, self.edge_rel)
+            for i, (source, target, rel) in enumerate(edges):
+                if rel == REL_IN_CATEGORY:
+                    job_category[source] = target
+                elif rel != REL_REQUIRES_SKILL:
+                    continue
+                job_out_edges[source].append(i)
+            self._job_edge_index = (self.num_edges, dict(job_out_edges), job_category)
+        return self._job_edge_index[1], self._job_edge_index[2]
+
+    def get_nodes_df(self, kind: Optional[str] = None) -> 'pd.DataFrame':
+        """
+        Get nodes as pandas DataFrame.
+
+        Each kind is built against its fixed schema, so pandas does not
+        infer columns across the disjoint job/skill/category attributes.
+
+        Args:
+            kind: 'job', 'skill' or 'category' for that kind's own frame;
+                None concatenates all kinds (jobs, then skills, then
+                categories)
+        """
         import pandas as pd
-        return pd.DataFrame(list(self.nodes.values()))
+
+        by_kind: Dict[str, List[Dict[str, Any]]] = {k: [] for k in NODE_COLUMNS}
+        for node in self.nodes.values():
+            by_kind[node['kind']].append(node)
+
+        kinds = [kind] if kind is not None else list(NODE_COLUMNS)
+        frames = [
+            _typed_frame(pd.DataFrame.from_records(by_kind[k], columns=NODE_COLUMNS[k]))
+            for k in kinds
+        ]
+        if len(frames) == 1:
+            return frames[0]
+        return _typed_frame(pd.concat(frames, ignore_index=True))
 
     def get_edges_df(self) -> 'pd.DataFrame':
         """Get edges as pandas DataFrame."""
         import pandas as pd
-        return pd.DataFrame(self.edges)
+
+        arrays = self.edge_arrays()
+        arrays['rel'] = pd.Categorical.from_codes(self.edge_rel, categories=REL_NAMES)
+        arrays['mapping_similarity'] = arrays['weight'] = [
+            None if v is None else round(v, 4) for v in self.edge_similarity
+        ]
+        return _typed_frame(pd.DataFrame({
+            c: arrays[c] for c in EDGE_COLUMNS
+            if not (c == 'thinking' and self.config.drop_thinking)
+        }))
+
+
+def _typed_frame(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Store the low-cardinality string columns as categoricals."""
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+def records_to_columns(
+    records: Collection[Dict[str, Any]],
+    columns: Sequence[str] = ()
+) -> Dict[str, List[Any]]:
+    """
+    Transpose row dicts into a column-oriented dict of lists.
+
+    Node kinds carry disjoint attributes, so rows stay dicts while the
+    graph is built and mutated; this produces the columnar layout that
+    writers and pandas consume, one C-level list build per column.
+
+    Known ``columns`` keep their given order, columns absent from every
+    record are dropped, and other keys follow in first-seen order.
+    Missing values are None.
+    """
+    # Collect keys in first-seen order (dict.update runs in C)
+    seen: Dict[str, Any] = {}
+    for record in records:
+        seen.update(record)
+
+    order = [c for c in columns if c in seen]
+    order += [c for c in seen if c not in columns]
+
+    return {c: [r.get(c) for r in records] for c in order}
@@ -6,17 +6,59 @@ to create proper overlap across jobs.
 """
 
 import re
+import heapq
 import logging
-from typing import Dict, Set, List, Optional, Any, Generator
+from array import array
+from typing import Dict, Set, List, Optional, Any, Generator, Iterable
 from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
+from .parser import JobRow
 from .utils import slugify
 
 
 logger = logging.getLogger('graph_builder')
 
+# Initial capacity of the per-skill counter arrays (grown by doubling)
+COUNTER_CAPACITY = 1 << 16
+
+# Pending counter updates are applied in bulk once this many accumulate
+COUNTER_FLUSH = 1 << 16
+
+# Normalization tables and patterns, built once
+_TRAIL_PUNCT = '.,:;!?'
+_AMP = re.compile(r'\b&\b')
+
+# Characters allowed next to digits in a numeric-only label. Normalized
+# labels hold no whitespace but single spaces, so this matches the old
+# ^[\d\s.,-]+$ test.
+_NUMERIC_PUNCT = frozenset(' .,-')
+
+# Slashes and Unicode dashes (en-dash, em-dash, minus sign) to hyphen
+_SEPARATOR_TABLE = str.maketrans({'/': '-', '–': '-', '—': '-', '−': '-'})
+
+
+class SkillEntry:
+    """
+    A canonical skill in the dictionary.
+
+    Slotted, since there is one per canonical skill. Per-skill counters
+    are not stored here; they live in the normalizer's arrays at idx.
+    The aliases themselves are the alias_map keys that point at this
+    entry; only their count is kept.
+    """
+
+    __slots__ = ('canonical_key', 'canonical_label', 'alias_count', 'idx', 'buckets')
+
+    def __init__(self, canonical_key: str, canonical_label: str, idx: int):
+        self.canonical_key = canonical_key
+        self.canonical_label = canonical_label
+        self.alias_count = 0
+        self.idx = idx
+        self.buckets: Set[str] = set()
+
 
 class SkillNormalizer:
     """
@@ -30,35 +72,63 @@ class SkillNormalizer:
     """
 
     def __init__(self):
-        # skill_key -> SkillEntry
-        self.skill_dictionary: Dict[str, Dict[str, Any]] = {}
-
-        # original_label -> skill_key (for lookup)
+        # skill_key -> SkillEntry; entry.idx is the skill's insertion
+        # position, which indexes the counter arrays below
+        self.skill_dictionary: Dict[str, SkillEntry] = {}
+
+        # Per-skill counters, indexed by entry.idx
+        self._occ = np.zeros(COUNTER_CAPACITY, dtype=np.int64)
+        self._max_sim = np.zeros(COUNTER_CAPACITY, dtype=np.float64)
+        self._sum_sim = np.zeros(COUNTER_CAPACITY, dtype=np.float64)
+
+        # Counter updates not yet applied to the arrays: the skill index
+        # per occurrence, and (index, similarity) per numeric similarity
+        self._pending_occ = array('q')
+        self._pending_sim_idx = array('q')
+        self._pending_sim = array('d')
+
+        # original_label -> skill_key (for lookup); also the only record
+        # of each skill's aliases
         self.alias_map: Dict[str, str] = {}
 
+        # Cached joined_aliases() result, reset when an alias is added
+        self._joined_aliases: Optional[List[str]] = None
+
+        # Set once process_all/process_streaming has seen every row
+        self.dictionary_complete = False
+
         # Statistics
         self.raw_skill_count = 0
         self.normalized_skill_count = 0
 
-    def process_all(self, data: List[Dict]) -> List[Dict]:
+        # Cached export_dictionary() frame, reset when the dictionary changes
+        self._dictionary_df: Optional[pd.DataFrame] = None
+
+    def process_all(self, data: Iterable[JobRow]) -> Generator[JobRow, None, None]:
         """
-        Process all data in two passes:
-        1. Build skill dictionary
-        2. Return data with normalized skill references
+        Register skills row by row and yield each row.
+
+        Rows are streamed through, so the dictionary is complete only
+        once the input is exhausted; the summary is logged at that point.
+        Each row's skills are registered before it is yielded, so the
+        graph builder can resolve skill IDs as rows arrive; lookups a
+        later row could still change (see may_resolve_later) wait for
+        dictionary_complete.
 
         Args:
-            data: List of parsed row dicts
+            data: Iterable of parsed JobRows
 
-        Returns:
-            Same data (skills now reference canonical keys)
+        Yields:
+            Parsed rows (same as input)
         """
         logger.info("Building skill dictionary...")
 
-        # Pass 1: Build dictionary
         for row in data:
-            for skill_entry in row.get('skills', []):
+            for skill_entry in row.skills:
                 self._register_skill(skill_entry)
+            yield row
 
+        self.dictionary_complete = True
         logger.info(
             f"Skill normalization complete: {self.raw_skill_count:,} raw -> "
             f"{len(self.skill_dictionary):,} canonical "
@@ -68,8 +138,6 @@ class SkillNormalizer:
         # Log top skills
         self._log_top_skills(10)
 
-        return data
-
     def process_streaming(self, data_generator: Generator) -> Generator:
         """
         Process data in streaming mode.
@@ -86,10 +154,12 @@ class SkillNormalizer:
         """
         for row in data_generator:
             # Register skills as we encounter them
-            for skill_entry in row.get('skills', []):
+            for skill_entry in row.skills:
                 self._register_skill(skill_entry)
             yield row
 
+        self.dictionary_complete = True
+
     def _register_skill(self, skill_entry: Dict[str, Any]) -> Optional[str]:
         """
         Register a skill in the dictionary.
@@ -110,7 +180,126 @@ class SkillNormalizer:
 
         self.raw_skill_count += 1
 
-        # Normalize and get canonical key
+        # Labels seen before skip normalization entirely
+        canonical_key = self.alias_map.get(raw_label)
+        if canonical_key is None:
+            canonical_key = self._canonical_key(raw_label)
+            if canonical_key is None:
+                return None
+
+            # Register in dictionary
+            if canonical_key not in self.skill_dictionary:
+                idx = len(self.skill_dictionary)
+                if idx == len(self._occ):
+                    self._grow_counters()
+                self.skill_dictionary[canonical_key] = SkillEntry(
+                    canonical_key, self._to_title_case(raw_label), idx
+                )
+            self.skill_dictionary[canonical_key].alias_count += 1
+
+            # Track alias mapping
+            self.alias_map[raw_label] = canonical_key
+            self._joined_aliases = None
+
+        self._dictionary_df = None
+        entry = self.skill_dictionary[canonical_key]
+        idx = entry.idx
+        self._pending_occ.append(idx)
+
+        similarity = skill_entry.get('mapping_similarity', 0)
+        if isinstance(similarity, (int, float)):
+            self._pending_sim_idx.append(idx)
+            self._pending_sim.append(similarity)
+
+        if len(self._pending_occ) >= COUNTER_FLUSH:
+            self._flush_counters()
+
+        bucket = skill_entry.get('bucket', '')
+        if bucket:
+            entry.buckets.add(bucket)
+
+        return canonical_key
+
+    def _flush_counters(self):
+        """
+        Apply pending updates to the counter arrays in bulk.
+
+        ufunc.at applies repeated indices one at a time in input order,
+        so sums accumulate exactly as per-skill += would. fmax skips NaN
+        the way the old `similarity > max` test did.
+        """
+        if self._pending_occ:
+            occ_idx = np.frombuffer(self._pending_occ, dtype=np.int64)
+            self._occ[:len(self.skill_dictionary)] += np.bincount(
+                occ_idx, minlength=len(self.skill_dictionary)
+            )
+            self._pending_occ = array('q')
+
+        if self._pending_sim_idx:
+            sim_idx = np.frombuffer(self._pending_sim_idx, dtype=np.int64)
+            sims = np.frombuffer(self._pending_sim, dtype=np.float64)
+            np.fmax.at(self._max_sim, sim_idx, sims)
+            np.add.at(self._sum_sim, sim_idx, sims)
+            self._pending_sim_idx = array('q')
+            self._pending_sim = array('d')
+
+    def _grow_counters(self):
+        """Double the capacity of the counter arrays."""
+        size = len(self._occ) * 2
+        for name in ('_occ', '_max_sim', '_sum_sim'):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def skill_counters(self) -> Dict[str, Any]:
+        """
+        Get per-skill counters, aligned with skill_dictionary order.
+
+        Returns:
+            Dict with an occurrence_count array and max_similarity /
+            avg_similarity lists rounded to 4 places. Rounding uses
+            round() rather than np.round, which scales by 10**4 first
+            and can land on the other side of a tie.
+        """
+        self._flush_counters()
+        n = len(self.skill_dictionary)
+        occ = self._occ[:n]
+        avg = np.divide(
+            self._sum_sim[:n], occ,
+            out=np.zeros(n, dtype=np.float64), where=occ > 0
+        )
+        return {
+            'occurrence_count': occ.copy(),
+            'max_similarity': [round(v, 4) for v in self._max_sim[:n].tolist()],
+            'avg_similarity': [round(v, 4) for v in avg.tolist()],
+        }
+
+    def joined_aliases(self) -> List[str]:
+        """
+        Get each skill's sorted aliases joined with '|'.
+
+        Aliases are grouped from alias_map in one pass on first use
+        rather than kept per skill during registration.
+
+        Returns:
+            List aligned with skill_dictionary order
+        """
+        if self._joined_aliases is None:
+            groups: List[List[str]] = [[] for _ in self.skill_dictionary]
+            entries = self.skill_dictionary
+            for raw_label, canonical_key in self.alias_map.items():
+                groups[entries[canonical_key].idx].append(raw_label)
+            self._joined_aliases = ['|'.join(sorted(group)) for group in groups]
+        return self._joined_aliases
+
+    def _canonical_key(self, raw_label: str) -> Optional[str]:
+        """
+        Normalize a stripped label and slugify it.
+
+        Returns:
+            Canonical key, or None if the label is not a usable skill
+        """
         normalized = self._normalize(raw_label)
         if not normalized:
             return None
@@ -125,43 +314,12 @@ class SkillNormalizer:
             logger.debug(f"Skipping long skill: '{raw_label[:50]}...'")
             return None
 
-        # Skip numeric-only
-        if re.match(r'^[\d\s.,-]+$', normalized):
+        # Skip numeric-only (exits on the first other character, usually
+        # the first one)
+        if all(ch.isdecimal() or ch in _NUMERIC_PUNCT for ch in normalized):
             return None
 
-        canonical_key = slugify(normalized)
-        if not canonical_key:
-            return None
-
-        # Register in dictionary
-        if canonical_key not in self.skill_dictionary:
-            self.skill_dictionary[canonical_key] = {
-                'canonical_key': canonical_key,
-                'canonical_label': self._to_title_case(raw_label),
-                'aliases': set(),
-                'occurrence_count': 0,
-                'max_similarity': 0.0,
-                'sum_similarity': 0.0,
-                'buckets': set()
-            }
-
-        entry = self.skill_dictionary[canonical_key]
-        entry['aliases'].add(raw_label)
-        entry['occurrence_count'] += 1
-
-        similarity = skill_entry.get('mapping_similarity', 0)
-        if isinstance(similarity, (int, float)):
-            entry['max_similarity'] = max(entry['max_similarity'], similarity)
-            entry['sum_similarity'] += similarity
-
-        bucket = skill_entry.get('bucket', '')
-        if bucket:
-            entry['buckets'].add(bucket)
-
-        # Track alias mapping
-        self.alias_map[raw_label] = canonical_key
-
-        return canonical_key
+        return slugify(normalized) or None
 
     def _normalize(self, raw_label: str) -> str:
         """
@@ -171,57 +329,44 @@ class SkillNormalizer:
         1. Strip whitespace
         2. Lowercase
         3. Remove trailing punctuation
-        4. Normalize whitespace
-        5. Normalize dashes/slashes
+        4. Normalize dashes/slashes
+        5. Normalize whitespace
         6. Expand common abbreviations
+
+        Each step is a single C-level string operation; the only regex
+        left runs when the label contains '&'.
         """
         s = raw_label.strip()
         if not s:
             return ""
 
-        # Lowercase
-        s = s.lower()
-
-        # Remove trailing punctuation
-        s = re.sub(r'[.,:;!?]+$', '', s)
-
-        # Normalize whitespace (collapse multiple spaces)
-        s = re.sub(r'\s+', ' ', s)
+        # Lowercase and remove trailing punctuation
+        s = s.lower().rstrip(_TRAIL_PUNCT)
 
-        # Normalize Unicode dashes to hyphen
-        s = s.replace('–', '-')  # en-dash
-        s = s.replace('—', '-')  # em-dash
-        s = s.replace('−', '-')  # minus sign
+        # Normalize slashes and Unicode dashes to hyphens
+        s = s.translate(_SEPARATOR_TABLE)
 
-        # Normalize slashes to hyphens
-        s = re.sub(r'\s*/\s*', '-', s)
+        # Collapse whitespace (split() also strips the ends)
+        s = ' '.join(s.split())
 
-        # Normalize spaces around hyphens
-        s = re.sub(r'\s*-\s*', '-', s)
+        # Drop the (now single) spaces around hyphens
+        s = s.replace(' -', '-').replace('- ', '-')
 
         # Expand common abbreviations
-        s = re.sub(r'\b&\b', ' and ', s)
-        s = re.sub(r'\bw/\b', 'with ', s)
-        s = re.sub(r'\bw/o\b', 'without ', s)
+        if '&' in s:
+            s = _AMP.sub(' and ', s)
 
-        # Collapse multiple spaces again after expansions
-        s = re.sub(r'\s+', ' ', s)
-
-        return s.strip()
+        return s
 
     def _to_title_case(self, text: str) -> str:
         """Convert to title case, preserving acronyms."""
-        words = text.split()
-        result = []
-
-        for word in words:
-            # Keep all-caps words (acronyms) as-is
-            if word.isupper() and len(word) <= 5:
-                result.append(word)
-            else:
-                result.append(word.capitalize())
-
-        return ' '.join(result)
+        # Keep all-caps words (acronyms) as-is. capitalize() rather than
+        # title() or upper()/lower() slices: those split on apostrophes
+        # and dots, or treat characters like 'ß' and 'ǆ' differently.
+        return ' '.join([
+            word if len(word) <= 5 and word.isupper() else word.capitalize()
+            for word in text.split()
+        ])
 
     def get_skill_id(self, raw_label: str) -> Optional[str]:
         """
@@ -251,35 +396,58 @@ class SkillNormalizer:
 
         return None
 
+    def may_resolve_later(self, raw_label: str) -> bool:
+        """
+        Whether get_skill_id(raw_label), having returned None, could
+        return a skill ID once more rows are registered.
+
+        A label the normalizer rejected falls back to its slug, which a
+        later label may still register while the dictionary is incomplete.
+        """
+        if self.dictionary_complete or not raw_label:
+            return False
+
+        raw_label = raw_label.strip()
+        if raw_label in self.alias_map:
+            return False
+
+        return bool(slugify(self._normalize(raw_label)))
+
     def get_canonical_label(self, skill_id: str) -> str:
         """Get the canonical label for a skill ID."""
         key = skill_id.replace('skill:', '')
-        entry = self.skill_dictionary.get(key, {})
-        return entry.get('canonical_label', key)
+        entry = self.skill_dictionary.get(key)
+        return entry.canonical_label if entry is not None else key
 
     def export_dictionary(self) -> pd.DataFrame:
-        """Export skill dictionary as DataFrame."""
-        records = []
-
-        for key, entry in self.skill_dictionary.items():
-            avg_sim = (
-                entry['sum_similarity'] / entry['occurrence_count']
-                if entry['occurrence_count'] > 0 else 0
-            )
-
-            records.append({
-                'skill_id': f"skill:{key}",
-                'canonical_key': key,
-                'canonical_label': entry['canonical_label'],
-                'aliases': '|'.join(sorted(entry['aliases'])),
-                'alias_count': len(entry['aliases']),
-                'occurrence_count': entry['occurrence_count'],
-                'max_similarity': round(entry['max_similarity'], 4),
-                'avg_similarity': round(avg_sim, 4),
-                'buckets': '|'.join(sorted(entry['buckets']))
-            })
+        """
+        Export skill dictionary as DataFrame.
 
-        df = pd.DataFrame(records)
+        The frame is built once and cached until another skill is
+        registered, so repeated callers share it; treat it as read-only.
+        """
+        if self._dictionary_df is None:
+            self._dictionary_df = self._build_dictionary_df()
+        return self._dictionary_df
+
+    def _build_dictionary_df(self) -> pd.DataFrame:
+        """Build the skill dictionary DataFrame, sorted by occurrence."""
+        entries = list(self.skill_dictionary.values())
+        keys = [entry.canonical_key for entry in entries]
+        counters = self.skill_counters()
+
+        # Column-wise; the counters come straight from the NumPy arrays
+        df = pd.DataFrame({
+            'skill_id': [f"skill:{key}" for key in keys],
+            'canonical_key': keys,
+            'canonical_label': [entry.canonical_label for entry in entries],
+            'aliases': self.joined_aliases(),
+            'alias_count': [entry.alias_count for entry in entries],
+            'occurrence_count': counters['occurrence_count'],
+            'max_similarity': counters['max_similarity'],
+            'avg_similarity': counters['avg_similarity'],
+            'buckets': ['|'.join(sorted(entry.buckets)) for entry in entries]
+        })
 
         # Sort by occurrence count descending
         if len(df) > 0:
@@ -295,17 +463,20 @@ class SkillNormalizer:
 
     def _log_top_skills(self, n: int = 10):
         """Log the top N skills by occurrence."""
-        sorted_skills = sorted(
-            self.skill_dictionary.items(),
-            key=lambda x: x[1]['occurrence_count'],
-            reverse=True
-        )[:n]
+        # Partial selection; no need to sort the whole dictionary for n rows
+        self._flush_counters()
+        occ = self._occ
+        sorted_skills = heapq.nlargest(
+            n,
+            self.skill_dictionary.values(),
+            key=lambda entry: occ[entry.idx]
+        )
 
         logger.info(f"Top {n} skills by occurrence:")
-        for key, entry in sorted_skills:
+        for entry in sorted_skills:
             logger.info(
-                f"  {entry['canonical_label']}: {entry['occurrence_count']:,} jobs, "
-                f"{len(entry['aliases'])} variants"
+                f"  {entry.canonical_label}: {occ[entry.idx]:,} jobs, "
+                f"{entry.alias_count} variants"
             )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -315,7 +486,7 @@ class SkillNormalizer:
             'canonical_skills': len(self.skill_dictionary),
             'dedup_ratio': round(self._dedup_ratio(), 4),
             'avg_aliases_per_skill': round(
-                sum(len(e['aliases']) for e in self.skill_dictionary.values()) /
+                len(self.alias_map) /
                 max(len(self.skill_dictionary), 1),
                 2
             )
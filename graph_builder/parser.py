@@ -3,19 +3,187 @@ Data parser for CSV and Excel files with streaming support.
 """
 
 import json
+import codecs
 import hashlib
 import logging
-from typing import Generator, Optional, Dict, List, Any
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Generator, Iterable, Optional, Dict, List, Any, Tuple
 from pathlib import Path
 
 import pandas as pd
 
-from .utils import safe_float, safe_int, safe_str, parse_boolean
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .utils import BOOLEAN_VALUES, safe_float, safe_int, safe_str
 from .config import Config
 
 
 logger = logging.getLogger('graph_builder')
 
+# Fields recorded for each row that fails to parse
+BAD_ROW_COLUMNS = ['row_idx', 'job_title', 'company_name', 'error']
+
+# CSV encodings to try, in order
+CSV_ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+
+# Bytes read from the start of a CSV to pick its encoding
+ENCODING_PROBE_BYTES = 1 << 20
+
+# Cell values read as missing, on top of pandas' defaults
+NA_VALUES = ['', 'NA', 'N/A', 'null', 'NULL', 'None', 'nan']
+
+# pandas' default NA strings, for readers that do not apply them
+_DEFAULT_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+]
+
+# Skills cells are decoded one at a time. Joining a chunk's cells into one
+# array would decode faster, but a malformed cell such as '[1],[2' can
+# shift its neighbours and still produce a valid array, so rows could
+# silently receive another row's skills.
+if orjson is not None:
+    def _loads(text: str) -> Any:
+        """orjson.loads, deferring to json.loads for anything orjson rejects."""
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (no NaN/Infinity literals, lone surrogates
+            # or integers beyond 64 bits); json accepts those, and raises
+            # the usual error text for really invalid input
+            return json.loads(text)
+else:
+    _loads = json.loads
+
+# Input columns read by _parse_frame, besides the configurable ones
+PARSED_COLUMNS = frozenset([
+    'Job Title', 'Company Name', 'Posted At', 'Schedule Type', 'Work From Home',
+    'District', 'NCO Code', 'Group', 'Hybrid NCO JD', 'token_count',
+    'Highest Similarity Spec', 'Highest Similarity Score Spec',
+    'salary_mean_inr_month', 'salary_currency_unit', 'salary_source'
+])
+
+# Work From Home values (lowercased) -> exported yes/no
+_WFH_VALUES = {
+    text: 'yes' if flag else 'no' for text, flag in BOOLEAN_VALUES.items()
+}
+
+
+@dataclass(slots=True)
+class JobRow:
+    """One parsed input row (a job with its cleaned skill entries)."""
+
+    job_id: str
+    job_title: str
+    company_name: str
+    posted_at: str
+    schedule_type: str
+    work_from_home: str
+    district: str
+    nco_code: str
+    group_name: str
+    assigned_occupation_group: str
+    hybrid_nco_jd: str
+    token_count: int
+    highest_similarity_spec: str
+    highest_similarity_score: float
+    salary_mean: float
+    salary_currency: str
+    salary_source: str
+    skills: List[Dict[str, Any]]
+    row_idx: int
+
+
+def _detect_encoding(path: str, encodings: List[str]) -> Optional[str]:
+    """
+    Pick the first encoding that decodes the start of the file.
+
+    The file is read once; each candidate decodes the same bytes
+    incrementally, so a character cut off at the end of the probe does
+    not count as an error.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(ENCODING_PROBE_BYTES)
+
+    for encoding in encodings:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+
+def _raw_column(frame: pd.DataFrame, column: str, default: Any) -> List[Any]:
+    """Column values as a list, or default for every row if it is absent."""
+    if column not in frame.columns:
+        return [default] * len(frame)
+    return frame[column].tolist()
+
+
+def _str_column(frame: pd.DataFrame, column: str) -> List[str]:
+    """safe_str over a whole column ('' for missing values or columns)."""
+    return [_to_str(v) for v in _raw_column(frame, column, '')]
+
+
+def _float_column(frame: pd.DataFrame, column: str) -> List[float]:
+    """safe_float over a whole column (0.0 for missing values or columns)."""
+    return [_to_float(v) for v in _raw_column(frame, column, 0)]
+
+
+def _to_str(val: Any) -> str:
+    """safe_str with a fast path for strings."""
+    return val.strip() if isinstance(val, str) else safe_str(val)
+
+
+def _to_float(val: Any) -> float:
+    """safe_float with fast paths for strings (read_csv) and floats (JSON)."""
+    if val.__class__ is float:
+        return val if val == val else 0.0
+    if isinstance(val, str):
+        try:
+            result = float(val)
+        except ValueError:
+            return 0.0
+        return result if result == result else 0.0
+    return safe_float(val)
+
+
+def _to_int(val: Any) -> int:
+    """
+    safe_int with a fast path for strings.
+
+    Like safe_int, an infinite value raises OverflowError, which fails
+    the row.
+    """
+    if isinstance(val, str):
+        try:
+            return int(float(val))
+        except ValueError:
+            return 0
+    return safe_int(val)
+
+
+def _parse_chunk(config: Config, frame: pd.DataFrame) -> Tuple[List[JobRow], List[Dict[str, Any]], int]:
+    """
+    Parse one chunk in a worker process.
+
+    Returns the parsed rows, the bad rows and the number of rows read.
+    Bad-row warnings are left to the parent, which replays the bad rows
+    in order.
+    """
+    parser = DataParser(config)
+    parser._warn_bad_rows = False
+    rows = list(parser._parse_frame(frame))
+    return rows, parser.bad_rows, parser.total_rows
+
 
 class DataParser:
     """
@@ -33,13 +201,14 @@ class DataParser:
         self.total_rows = 0
         self.parsed_rows = 0
         self._columns = []
+        self._warn_bad_rows = True
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+    def parse(self) -> Generator[JobRow, None, None]:
         """
         Parse input file and yield rows one at a time.
 
         Yields:
-            Dict containing parsed job data
+            JobRow containing parsed job data
         """
         input_path = Path(self.config.input_path)
         ext = input_path.suffix.lower()
@@ -56,25 +225,15 @@ class DataParser:
             f"({len(self.bad_rows)} failures)"
         )
 
-    def _parse_csv(self) -> Generator[Dict[str, Any], None, None]:
+    def _parse_csv(self) -> Generator[JobRow, None, None]:
         """Parse CSV file in chunks."""
         logger.info(f"Reading CSV: {self.config.input_path}")
 
-        # Try multiple encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        encoding_used = None
-
-        for encoding in encodings:
-            try:
-                sample = pd.read_csv(self.config.input_path, nrows=1, encoding=encoding)
-                encoding_used = encoding
-                logger.info(f"Using encoding: {encoding}")
-                break
-            except UnicodeDecodeError:
-                continue
-
+        # Try multiple encodings on one read of the file's first bytes
+        encoding_used = _detect_encoding(self.config.input_path, CSV_ENCODINGS)
         if not encoding_used:
-            raise ValueError(f"Could not determine file encoding. Tried: {encodings}")
+            raise ValueError(f"Could not determine file encoding. Tried: {CSV_ENCODINGS}")
+        logger.info(f"Using encoding: {encoding_used}")
 
         try:
             # First, get columns
@@ -82,40 +241,80 @@ class DataParser:
             self._columns = list(sample.columns)
             logger.info(f"Found {len(self._columns)} columns")
 
-            # Read in chunks
+            if self.config.csv_engine == 'pyarrow':
+                yield from self._parse_csv_arrow(encoding_used)
+                return
+
+            # Read in chunks, skipping columns that are never parsed
+            needed = self._needed_columns()
             chunks = pd.read_csv(
                 self.config.input_path,
                 chunksize=self.config.chunk_size,
+                usecols=lambda column: column in needed,
                 dtype=str,  # Read all as string initially
-                na_values=['', 'NA', 'N/A', 'null', 'NULL', 'None', 'nan'],
+                na_values=NA_VALUES,
                 keep_default_na=True,
                 low_memory=False,
                 encoding=encoding_used
             )
 
-            for chunk_num, chunk in enumerate(chunks):
-                logger.debug(f"Processing chunk {chunk_num + 1}")
-
-                for idx, row in chunk.iterrows():
-                    self.total_rows += 1
-
-                    try:
-                        parsed = self._parse_row(row, idx)
-                        if parsed:
-                            self.parsed_rows += 1
-                            yield parsed
-                    except Exception as e:
-                        self._log_bad_row(idx, row, str(e))
-
-                # Progress logging
-                if self.total_rows % 10000 == 0:
-                    logger.info(f"Processed {self.total_rows:,} rows...")
+            yield from self._parse_frames(chunks)
 
         except Exception as e:
             logger.error(f"Failed to read CSV: {e}")
             raise
 
-    def _parse_excel(self) -> Generator[Dict[str, Any], None, None]:
+    def _parse_csv_arrow(self, encoding: str) -> Generator[JobRow, None, None]:
+        """
+        Parse CSV file with pyarrow's multi-threaded streaming reader.
+
+        Every parsed column is read as a string with pandas' NA values, so rows
+        convert exactly as with read_csv(dtype=str). Column names come
+        from the pandas sample, which keeps pandas' renaming of
+        duplicate headers. Batches are sized in bytes by pyarrow.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        needed = self._needed_columns()
+
+        def chunks():
+            # The file is memory-mapped: pyarrow reads straight from the
+            # page cache instead of copying through a Python file object
+            with pa.memory_map(self.config.input_path, 'r') as source:
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(
+                        column_names=self._columns,
+                        skip_rows=1,
+                        encoding=encoding
+                    ),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={name: pa.string() for name in self._columns},
+                        include_columns=[name for name in self._columns if name in needed],
+                        null_values=sorted(set(_DEFAULT_NA_VALUES) | set(NA_VALUES)),
+                        strings_can_be_null=True
+                    )
+                )
+
+                start = 0
+                for batch in reader:
+                    chunk = batch.to_pandas()
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    yield chunk
+
+        yield from self._parse_frames(chunks())
+
+    def _needed_columns(self) -> frozenset:
+        """Names of the input columns that parsing reads."""
+        config = self.config
+        needed = {config.skills_column, config.category_column, config.fallback_category_column}
+        if config.job_id_column != 'auto':
+            needed.add(config.job_id_column)
+        return PARSED_COLUMNS | needed
+
+    def _parse_excel(self) -> Generator[JobRow, None, None]:
         """Parse Excel file."""
         logger.info(f"Reading Excel: {self.config.input_path}")
 
@@ -124,97 +323,177 @@ class DataParser:
             df = pd.read_excel(
                 self.config.input_path,
                 dtype=str,
-                na_values=['', 'NA', 'N/A', 'null', 'NULL', 'None', 'nan']
+                na_values=NA_VALUES
             )
 
             self._columns = list(df.columns)
             logger.info(f"Found {len(self._columns)} columns, {len(df):,} rows")
 
-            for idx, row in df.iterrows():
-                self.total_rows += 1
-
-                try:
-                    parsed = self._parse_row(row, idx)
-                    if parsed:
-                        self.parsed_rows += 1
-                        yield parsed
-                except Exception as e:
-                    self._log_bad_row(idx, row, str(e))
-
-                # Progress logging
-                if self.total_rows % 10000 == 0:
-                    logger.info(f"Processed {self.total_rows:,} rows...")
+            # Convert in chunk_size slices, as for CSV
+            step = max(self.config.chunk_size, 1)
+            yield from self._parse_frames(
+                df.iloc[start:start + step] for start in range(0, len(df), step)
+            )
 
         except Exception as e:
             logger.error(f"Failed to read Excel: {e}")
             raise
 
-    def _parse_row(self, row: pd.Series, row_idx: int) -> Optional[Dict[str, Any]]:
+    def _parse_frames(self, frames: Iterable[pd.DataFrame]) -> Generator[JobRow, None, None]:
         """
-        Parse a single row into structured data.
+        Parse chunks in order, in this process or in a worker pool.
 
-        Args:
-            row: pandas Series representing a row
-            row_idx: Row index for error tracking
+        With parse_workers != 1, chunks go to a process pool (0 = one
+        worker per CPU). At most two chunks per worker are in flight, so
+        the reader never runs far ahead of the consumer, and results are
+        taken in submission order, so rows come out exactly as with a
+        single process.
+        """
+        workers = self.config.parse_workers or os.cpu_count() or 1
 
-        Returns:
-            Parsed row dict or None if parsing fails
+        if workers == 1:
+            for chunk_num, frame in enumerate(frames):
+                logger.debug(f"Processing chunk {chunk_num + 1}")
+
+                yield from self._parse_frame(frame)
+                self._log_progress()
+            return
+
+        logger.info(f"Parsing with {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for frame in frames:
+                pending.append(executor.submit(_parse_chunk, self.config, frame))
+                if len(pending) >= 2 * workers:
+                    yield from self._collect_chunk(pending.popleft().result())
+
+            while pending:
+                yield from self._collect_chunk(pending.popleft().result())
+
+    def _collect_chunk(
+        self,
+        result: Tuple[List[JobRow], List[Dict[str, Any]], int]
+    ) -> Generator[JobRow, None, None]:
+        """Merge one worker result into this parser's counts and bad rows."""
+        rows, bad_rows, total_rows = result
+        for bad_row in bad_rows:
+            self._log_bad_row(**bad_row)
+        self.total_rows += total_rows
+        self.parsed_rows += len(rows)
+
+        yield from rows
+        self._log_progress()
+
+    def _log_progress(self):
+        """Log progress at every 10,000th row."""
+        if self.total_rows % 10000 == 0:
+            logger.info(f"Processed {self.total_rows:,} rows...")
+
+    def _parse_frame(self, frame: pd.DataFrame) -> Generator[JobRow, None, None]:
         """
-        # Parse skills JSON first (most likely to fail)
-        skills_raw = safe_str(row.get(self.config.skills_column, ''))
-        skills = self._parse_skills_json(skills_raw, row_idx)
-
-        # Generate job ID
-        job_id = self._get_job_id(row, row_idx)
-
-        # Get category
-        category = safe_str(row.get(self.config.category_column, ''))
-        if not category:
-            category = safe_str(row.get(self.config.fallback_category_column, ''))
-
-        # Parse work from home
-        wfh_raw = safe_str(row.get('Work From Home', ''))
-        wfh = parse_boolean(wfh_raw)
-        wfh_str = 'yes' if wfh is True else ('no' if wfh is False else '')
-
-        return {
-            'job_id': job_id,
-            'job_title': safe_str(row.get('Job Title', '')),
-            'company_name': safe_str(row.get('Company Name', '')),
-            'posted_at': safe_str(row.get('Posted At', '')),
-            'schedule_type': safe_str(row.get('Schedule Type', '')),
-            'work_from_home': wfh_str,
-            'district': safe_str(row.get('District', '')),
-            'nco_code': safe_str(row.get('NCO Code', '')),
-            'group_name': safe_str(row.get('Group', '')),
-            'assigned_occupation_group': category,
-            'hybrid_nco_jd': safe_str(row.get('Hybrid NCO JD', '')),
-            'token_count': safe_int(row.get('token_count', 0)),
-            'highest_similarity_spec': safe_str(row.get('Highest Similarity Spec', '')),
-            'highest_similarity_score': safe_float(row.get('Highest Similarity Score Spec', 0)),
-            'salary_mean': safe_float(row.get('salary_mean_inr_month', 0)),
-            'salary_currency': safe_str(row.get('salary_currency_unit', '')),
-            'salary_source': safe_str(row.get('salary_source', '')),
-            'skills': skills,
-            '_row_idx': row_idx
-        }
-
-    def _get_job_id(self, row: pd.Series, row_idx: int) -> str:
-        """Generate or extract job ID."""
-        if self.config.job_id_column != 'auto':
-            job_id = safe_str(row.get(self.config.job_id_column, ''))
-            if job_id:
-                return job_id
-
-        # Generate deterministic ID from unique combination
-        title = safe_str(row.get('Job Title', ''))
-        company = safe_str(row.get('Company Name', ''))
-        district = safe_str(row.get('District', ''))
-
-        unique_key = f"{title}|{company}|{district}|{row_idx}"
-        hash_val = hashlib.md5(unique_key.encode()).hexdigest()[:16]
-
-        return hash_val
+        Parse a chunk of rows column by column.
+
+        String and float columns are converted once per chunk, so rows
+        never become pandas Series. Steps that can fail (skills JSON,
+        token_count) still run per row, so one bad cell only fails its
+        own row.
+
+        Yields:
+            JobRow per parsed row, in input order
+        """
+        n = len(frame)
+        config = self.config
+        row_idxs = frame.index.tolist()
+
+        titles = _str_column(frame, 'Job Title')
+        companies = _str_column(frame, 'Company Name')
+        districts = _str_column(frame, 'District')
+        skills_raw = _str_column(frame, config.skills_column)
+
+        # Category falls back per row when the primary column is empty
+        categories = [
+            category or fallback
+            for category, fallback in zip(
+                _str_column(frame, config.category_column),
+                _str_column(frame, config.fallback_category_column)
+            )
+        ]
+
+        if config.job_id_column != 'auto':
+            given_ids = _str_column(frame, config.job_id_column)
+        else:
+            given_ids = [''] * n
+        job_ids = self._get_job_ids(given_ids, titles, companies, districts, row_idxs)
+
+        # Bad rows report missing title/company columns as 'unknown'
+        bad_titles = titles if 'Job Title' in frame.columns else ['unknown'] * n
+        bad_companies = companies if 'Company Name' in frame.columns else ['unknown'] * n
+
+        columns = zip(
+            row_idxs,
+            titles,
+            companies,
+            _str_column(frame, 'Posted At'),
+            _str_column(frame, 'Schedule Type'),
+            [_WFH_VALUES.get(v.lower(), '') for v in _str_column(frame, 'Work From Home')],
+            districts,
+            _str_column(frame, 'NCO Code'),
+            _str_column(frame, 'Group'),
+            categories,
+            _str_column(frame, 'Hybrid NCO JD'),
+            _raw_column(frame, 'token_count', 0),
+            _str_column(frame, 'Highest Similarity Spec'),
+            _float_column(frame, 'Highest Similarity Score Spec'),
+            _float_column(frame, 'salary_mean_inr_month'),
+            _str_column(frame, 'salary_currency_unit'),
+            _str_column(frame, 'salary_source'),
+            skills_raw,
+            job_ids,
+        )
+
+        for i, (row_idx, title, company, posted_at, schedule_type, wfh, district,
+                nco_code, group_name, category, jd_text, token_count, spec,
+                spec_score, salary_mean, salary_currency, salary_source,
+                skills_text, job_id) in enumerate(columns):
+            self.total_rows += 1
+
+            try:
+                # Parse skills JSON first (most likely to fail)
+                skills = self._parse_skills_json(skills_text, row_idx)
+
+                parsed = JobRow(
+                    job_id, title, company, posted_at, schedule_type, wfh,
+                    district, nco_code, group_name, category, jd_text,
+                    _to_int(token_count), spec, spec_score, salary_mean,
+                    salary_currency, salary_source, skills, row_idx
+                )
+            except Exception as e:
+                self._log_bad_row(row_idx, bad_titles[i], bad_companies[i], str(e))
+                continue
+
+            self.parsed_rows += 1
+            yield parsed
+
+    def _get_job_ids(
+        self,
+        given_ids: List[str],
+        titles: List[str],
+        companies: List[str],
+        districts: List[str],
+        row_idxs: List[int]
+    ) -> List[str]:
+        """
+        Get job IDs for a chunk of rows.
+
+        Rows without an ID from job_id_column get a deterministic one:
+        the first 16 hex digits of md5("title|company|district|row_idx").
+        """
+        md5 = hashlib.md5
+        return [
+            given_id or md5(f"{title}|{company}|{district}|{row_idx}".encode()).hexdigest()[:16]
+            for given_id, title, company, district, row_idx
+            in zip(given_ids, titles, companies, districts, row_idxs)
+        ]
 
     def _parse_skills_json(self, text: str, row_idx: int) -> List[Dict[str, Any]]:
         """
@@ -233,27 +512,32 @@ class DataParser:
             return []
 
         try:
-            skills = json.loads(text)
+            skills = _loads(text)
 
             if not isinstance(skills, list):
                 logger.warning(f"Row {row_idx}: skills is not a list")
                 return []
 
-            # Validate and clean each skill entry
+            # Validate and clean each skill entry (converters bound to
+            # locals; this runs once per skill of every row)
+            to_str = _to_str
+            to_float = _to_float
             valid_skills = []
+            append = valid_skills.append
             for skill_entry in skills:
                 if not isinstance(skill_entry, dict):
                     continue
 
-                skill_label = safe_str(skill_entry.get('skill', ''))
+                get = skill_entry.get
+                skill_label = to_str(get('skill', ''))
                 if not skill_label:
                     continue
 
-                valid_skills.append({
+                append({
                     'skill': skill_label,
-                    'bucket': safe_str(skill_entry.get('bucket', '')),
-                    'mapping_similarity': safe_float(skill_entry.get('mapping_similarity', 0)),
-                    'thinking': safe_str(skill_entry.get('thinking', ''))
+                    'bucket': to_str(get('bucket', '')),
+                    'mapping_similarity': to_float(get('mapping_similarity', 0)),
+                    'thinking': to_str(get('thinking', ''))
                 })
 
             return valid_skills
@@ -263,15 +547,17 @@ class DataParser:
             logger.debug(f"Row {row_idx}: JSON parse error - {e}")
             raise ValueError(f"Invalid skills JSON: {e}")
 
-    def _log_bad_row(self, row_idx: int, row: pd.Series, error: str):
+    def _log_bad_row(self, row_idx: int, job_title: str, company_name: str, error: str):
         """Log a failed row to bad_rows list."""
         self.bad_rows.append({
             'row_idx': row_idx,
-            'job_title': safe_str(row.get('Job Title', 'unknown')),
-            'company_name': safe_str(row.get('Company Name', 'unknown')),
+            'job_title': job_title,
+            'company_name': company_name,
             'error': error
         })
 
+        if not self._warn_bad_rows:
+            return
         if len(self.bad_rows) <= 10:
             logger.warning(f"Row {row_idx} failed: {error}")
         elif len(self.bad_rows) == 11:
@@ -279,7 +565,7 @@ class DataParser:
 
     def get_bad_rows_df(self) -> pd.DataFrame:
         """Get bad rows as DataFrame for export."""
-        return pd.DataFrame(self.bad_rows)
+        return pd.DataFrame(self.bad_rows, columns=BAD_ROW_COLUMNS)
 
     @property
     def columns(self) -> List[str]:
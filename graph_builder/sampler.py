@@ -6,17 +6,17 @@ Two modes:
 2. Performance sampling (perf): Size-bounded for Gephi usability
 """
 
-import random
+import heapq
 import logging
 import math
 from typing import Dict, List, Any, Set, Optional, Tuple
-from collections import defaultdict, Counter
+from collections import Counter, defaultdict
 from abc import ABC, abstractmethod
 
 import numpy as np
 
 from .config import Config
-from .graph import GraphBuilder
+from .graph import GraphBuilder, REL_REQUIRES_SKILL
 from .utils import z_score
 
 
@@ -42,6 +42,9 @@ class BaseSampler(ABC):
         Preserves graph integrity:
         - All skills connected to sampled jobs
         - All categories connected to sampled jobs
+
+        Node dicts are shared with the original graph, not copied; nodes
+        are only mutated while the original graph is being built.
         """
         # Create new graph builder with same config
         subgraph = GraphBuilder(original.config)
@@ -49,30 +52,41 @@ class BaseSampler(ABC):
         # Copy sampled job nodes
         for job_id in sampled_job_ids:
             if job_id in original.nodes:
-                subgraph.nodes[job_id] = original.nodes[job_id].copy()
+                subgraph.nodes[job_id] = original.nodes[job_id]
+                subgraph.n_jobs += 1
 
         # Find connected skills and categories
         connected_skills: Set[str] = set()
         connected_categories: Set[str] = set()
 
-        for edge in original.edges:
-            if edge['source'] in sampled_job_ids:
-                if edge['rel'] == 'REQUIRES_SKILL':
-                    connected_skills.add(edge['target'])
-                    subgraph.edges.append(edge.copy())
-                elif edge['rel'] == 'IN_CATEGORY':
-                    connected_categories.add(edge['target'])
-                    subgraph.edges.append(edge.copy())
+        # Only the sampled jobs' edges are visited; sorting keeps the
+        # original edge order (and so the set insertion order)
+        job_out_edges, _ = original.job_edge_index()
+        kept_edges: List[int] = []
+        for job_id in sampled_job_ids:
+            kept_edges.extend(job_out_edges.get(job_id, ()))
+        kept_edges.sort()
+
+        edge_target = original.edge_target
+        edge_rel = original.edge_rel
+        for i in kept_edges:
+            if edge_rel[i] == REL_REQUIRES_SKILL:
+                connected_skills.add(edge_target[i])
+            else:
+                connected_categories.add(edge_target[i])
+        subgraph.take_edges(original, kept_edges)
 
         # Add skill nodes
         for skill_id in connected_skills:
             if skill_id in original.nodes:
-                subgraph.nodes[skill_id] = original.nodes[skill_id].copy()
+                subgraph.nodes[skill_id] = original.nodes[skill_id]
+                subgraph.n_skills += 1
 
         # Add category nodes
         for cat_id in connected_categories:
             if cat_id in original.nodes:
-                subgraph.nodes[cat_id] = original.nodes[cat_id].copy()
+                subgraph.nodes[cat_id] = original.nodes[cat_id]
+                subgraph.n_categories += 1
 
         # Update tracking sets
         subgraph.jobs_with_skills = sampled_job_ids & original.jobs_with_skills
@@ -81,7 +95,7 @@ class BaseSampler(ABC):
 
         logger.info(
             f"Subgraph created: {len(subgraph.nodes):,} nodes, "
-            f"{len(subgraph.edges):,} edges"
+            f"{subgraph.num_edges:,} edges"
         )
 
         return subgraph
@@ -114,9 +128,6 @@ class StatisticalSampler(BaseSampler):
         Returns:
             Subgraph with sampled jobs
         """
-        random.seed(config.subset_seed)
-        np.random.seed(config.subset_seed)
-
         # Get all jobs
         jobs = {
             node_id: node
@@ -132,7 +143,8 @@ class StatisticalSampler(BaseSampler):
         logger.info(f"Target sample size: {n:,} (using Cochran's formula)")
 
         # Stratify by category
-        strata = self._stratify_jobs(jobs, graph)
+        _, job_category = graph.job_edge_index()
+        strata = self._stratify_jobs(jobs, job_category)
         logger.info(f"Found {len(strata):,} categories for stratification")
 
         # Allocate samples per stratum
@@ -143,7 +155,9 @@ class StatisticalSampler(BaseSampler):
         logger.info(f"Sampled {len(sampled_job_ids):,} jobs")
 
         # Build report
-        self.report = self._build_report(N, n, config, strata, allocation, sampled_job_ids)
+        self.report = self._build_report(
+            N, n, config, strata, job_category, allocation, sampled_job_ids
+        )
 
         # Build subgraph
         return self._build_subgraph(graph, sampled_job_ids)
@@ -191,7 +205,7 @@ class StatisticalSampler(BaseSampler):
     def _stratify_jobs(
         self,
         jobs: Dict[str, Dict],
-        graph: GraphBuilder
+        job_category: Dict[str, str]
     ) -> Dict[str, List[str]]:
         """
         Group jobs by category.
@@ -201,12 +215,6 @@ class StatisticalSampler(BaseSampler):
         """
         strata: Dict[str, List[str]] = defaultdict(list)
 
-        # Build job -> category mapping from edges
-        job_category = {}
-        for edge in graph.edges:
-            if edge['rel'] == 'IN_CATEGORY':
-                job_category[edge['source']] = edge['target']
-
         # Group by category
         for job_id in jobs:
             cat_id = job_category.get(job_id, 'uncategorized')
@@ -271,6 +279,7 @@ class StatisticalSampler(BaseSampler):
         config: Config
     ) -> Set[str]:
         """Sample from each stratum according to allocation."""
+        rng = np.random.default_rng(config.subset_seed)
         sampled: Set[str] = set()
 
         for cat_id, jobs in strata.items():
@@ -278,8 +287,9 @@ class StatisticalSampler(BaseSampler):
             n_h = min(n_h, len(jobs))  # Can't sample more than exists
 
             if n_h > 0:
-                selected = random.sample(jobs, n_h)
-                sampled.update(selected)
+                # Positions drawn in C; only the picked IDs are touched
+                picks = rng.choice(len(jobs), size=n_h, replace=False, shuffle=False)
+                sampled.update(map(jobs.__getitem__, picks.tolist()))
 
         return sampled
 
@@ -289,10 +299,16 @@ class StatisticalSampler(BaseSampler):
         n: int,
         config: Config,
         strata: Dict[str, List[str]],
+        job_category: Dict[str, str],
         allocation: Dict[str, int],
         sampled: Set[str]
     ) -> Dict[str, Any]:
         """Build the sampling report."""
+        # Count sampled jobs per stratum in one pass over the sample
+        sampled_per_category = Counter(
+            job_category.get(job_id, 'uncategorized') for job_id in sampled
+        )
+
         return {
             'sampling_mode': 'stats',
             'population': {
@@ -317,7 +333,7 @@ class StatisticalSampler(BaseSampler):
                 cat_id: {
                     'population': len(strata[cat_id]),
                     'allocated': allocation.get(cat_id, 0),
-                    'sampled': sum(1 for j in sampled if j in strata[cat_id])
+                    'sampled': sampled_per_category[cat_id]
                 }
                 for cat_id in strata
             },
@@ -347,8 +363,6 @@ class PerformanceSampler(BaseSampler):
         Returns:
             Subgraph within size bounds
         """
-        random.seed(config.subset_seed)
-
         # Get all jobs
         jobs = {
             node_id: node
@@ -364,22 +378,27 @@ class PerformanceSampler(BaseSampler):
         categories = self._select_categories(graph, config)
         logger.info(f"Selected {len(categories):,} categories")
 
-        # Get jobs in selected categories
-        eligible_jobs = self._get_jobs_in_categories(jobs, graph, categories)
-        logger.info(f"Eligible jobs: {len(eligible_jobs):,}")
+        # Group eligible jobs by category (job -> category built once)
+        _, job_category = graph.job_edge_index()
+        strata = self._stratify_eligible_jobs(jobs, job_category, categories)
+        n_eligible = sum(map(len, strata.values()))
+        logger.info(f"Eligible jobs: {n_eligible:,}")
 
         # Estimate max jobs for target size
         max_jobs = self._estimate_max_jobs(config)
         logger.info(f"Estimated max jobs for size target: {max_jobs:,}")
 
         # Sample jobs
-        sampled_job_ids = self._sample_within_budget(
-            eligible_jobs, graph, max_jobs, config
-        )
+        if n_eligible <= max_jobs:
+            sampled_job_ids = set().union(*strata.values())
+        else:
+            sampled_job_ids = self._sample_within_budget(
+                strata, n_eligible, max_jobs, config
+            )
         logger.info(f"Sampled {len(sampled_job_ids):,} jobs")
 
         # Build report
-        self.report = self._build_report(config, categories, eligible_jobs, sampled_job_ids)
+        self.report = self._build_report(config, categories, n_eligible, sampled_job_ids)
 
         # Build subgraph
         return self._build_subgraph(graph, sampled_job_ids)
@@ -394,40 +413,43 @@ class PerformanceSampler(BaseSampler):
             # User-specified categories
             return set(f"cat:{c}" for c in config.category_list)
 
-        # Get all categories with job counts
-        cat_counts: Counter = Counter()
-        for edge in graph.edges:
-            if edge['rel'] == 'IN_CATEGORY':
-                cat_counts[edge['target']] += 1
+        # Category nodes already count their IN_CATEGORY edges (job_count)
+        # and are stored in first-seen order, so no edge scan is needed
+        cat_counts = {
+            node_id: node['job_count']
+            for node_id, node in graph.nodes.items()
+            if node['kind'] == 'category'
+        }
 
         if config.subset_categories > 0:
-            # Top N categories by job count
-            top_cats = cat_counts.most_common(config.subset_categories)
-            return set(cat_id for cat_id, _ in top_cats)
+            # Top N categories by job count; ties keep first-seen order,
+            # as Counter.most_common did
+            top_cats = heapq.nlargest(
+                config.subset_categories, cat_counts, key=cat_counts.__getitem__
+            )
+            return set(top_cats)
 
         # All categories
-        return set(cat_counts.keys())
+        return set(cat_counts)
 
-    def _get_jobs_in_categories(
+    def _stratify_eligible_jobs(
         self,
         jobs: Dict[str, Dict],
-        graph: GraphBuilder,
+        job_category: Dict[str, str],
         categories: Set[str]
-    ) -> List[str]:
-        """Get jobs that belong to selected categories."""
-        # Build job -> category mapping
-        job_category = {}
-        for edge in graph.edges:
-            if edge['rel'] == 'IN_CATEGORY':
-                job_category[edge['source']] = edge['target']
-
-        eligible = [
-            job_id
-            for job_id in jobs
-            if job_category.get(job_id) in categories
-        ]
-
-        return eligible
+    ) -> Dict[str, List[str]]:
+        """
+        Group the jobs of the selected categories by category.
+
+        One pass over the jobs; strata and their members keep graph order.
+        """
+        strata: Dict[str, List[str]] = defaultdict(list)
+        for job_id in jobs:
+            cat_id = job_category.get(job_id)
+            if cat_id in categories:
+                strata[cat_id].append(job_id)
+
+        return dict(strata)
 
     def _estimate_max_jobs(self, config: Config) -> int:
         """
@@ -453,37 +475,23 @@ class PerformanceSampler(BaseSampler):
 
     def _sample_within_budget(
         self,
-        eligible_jobs: List[str],
-        graph: GraphBuilder,
+        strata: Dict[str, List[str]],
+        N: int,
         max_jobs: int,
         config: Config
     ) -> Set[str]:
-        """Sample jobs within budget, stratified by category."""
-        if len(eligible_jobs) <= max_jobs:
-            return set(eligible_jobs)
-
-        # Stratify for balanced sampling
-        job_category = {}
-        for edge in graph.edges:
-            if edge['rel'] == 'IN_CATEGORY':
-                job_category[edge['source']] = edge['target']
-
-        strata: Dict[str, List[str]] = defaultdict(list)
-        for job_id in eligible_jobs:
-            cat_id = job_category.get(job_id, 'uncategorized')
-            strata[cat_id].append(job_id)
-
+        """Sample about max_jobs of the N eligible jobs, stratified by category."""
         # Proportional allocation
+        rng = np.random.default_rng(config.subset_seed)
         sampled: Set[str] = set()
-        N = len(eligible_jobs)
 
         for cat_id, jobs in strata.items():
             proportion = len(jobs) / N
             n_h = max(1, int(max_jobs * proportion))
             n_h = min(n_h, len(jobs))
 
-            selected = random.sample(jobs, n_h)
-            sampled.update(selected)
+            picks = rng.choice(len(jobs), size=n_h, replace=False, shuffle=False)
+            sampled.update(map(jobs.__getitem__, picks.tolist()))
 
             if len(sampled) >= max_jobs:
                 break
@@ -494,7 +502,7 @@ class PerformanceSampler(BaseSampler):
         self,
         config: Config,
         categories: Set[str],
-        eligible_jobs: List[str],
+        n_eligible: int,
         sampled: Set[str]
     ) -> Dict[str, Any]:
         """Build the sampling report."""
@@ -509,7 +517,7 @@ class PerformanceSampler(BaseSampler):
                 'seed': config.subset_seed
             },
             'result': {
-                'eligible_jobs': len(eligible_jobs),
+                'eligible_jobs': n_eligible,
                 'jobs_sampled': len(sampled),
                 'categories_included': len(categories)
             }
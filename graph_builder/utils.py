@@ -4,9 +4,64 @@ Utility functions for the graph builder.
 
 import re
 import logging
+import time
 import unicodedata
 from typing import Optional, Any
-from datetime import datetime
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+# Control characters that are invalid in XML
+_XML_INVALID_CHARS = [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f]
+
+# XML special characters -> entities and invalid control characters
+# removed, applied in a single C-level pass
+XML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+    **dict.fromkeys(map(chr, _XML_INVALID_CHARS))
+})
+
+# Accepted boolean spellings (lowercased), resolved with one dict lookup
+BOOLEAN_VALUES = {
+    'yes': True, 'true': True, '1': True, 'y': True,
+    'no': False, 'false': False, '0': False, 'n': False
+}
+
+# Units for format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Two-sided Z-scores for common confidence levels
+Z_SCORES = {
+    0.80: 1.282,
+    0.85: 1.440,
+    0.90: 1.645,
+    0.95: 1.960,
+    0.975: 2.241,
+    0.99: 2.576,
+    0.995: 2.807,
+    0.999: 3.291
+}
+
+# Runs of characters that slugify turns into a single hyphen
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Anything escape_xml would change, for its clean-string fast path
+_XML_ESCAPE_RE = re.compile(r'[&<>"\'\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Up to this length a regex scan for escapable characters is cheaper than
+# translate, which always builds a new string; beyond it translate wins
+_XML_PRESCAN_MAX = 128
+
+# The invalid control characters as a regex; faster than translate for short,
+# clean strings such as node IDs
+_XML_INVALID_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -33,6 +88,10 @@ def slugify(text: str) -> str:
     if not text:
         return ""
 
+    # ASCII text is unchanged by the normalization below
+    if text.isascii():
+        return _NON_ALNUM_RE.sub('-', text.lower()).strip('-')
+
     # Convert to lowercase
     text = text.lower()
 
@@ -40,38 +99,55 @@ def slugify(text: str) -> str:
     text = unicodedata.normalize('NFKD', text)
     text = text.encode('ascii', 'ignore').decode('ascii')
 
-    # Replace non-alphanumeric with hyphens
-    text = re.sub(r'[^a-z0-9]+', '-', text)
+    # Replace each run of non-alphanumerics (hyphens included) with one
+    # hyphen, so no hyphen runs are left to collapse
+    text = _NON_ALNUM_RE.sub('-', text)
 
     # Remove leading/trailing hyphens
-    text = text.strip('-')
-
-    # Collapse multiple hyphens
-    text = re.sub(r'-+', '-', text)
-
-    return text
+    return text.strip('-')
 
 
 def escape_xml(text: str) -> str:
     """
     Escape special characters for XML.
 
-    Handles: & < > " '
+    Handles: & < > " ' and drops control characters invalid in XML.
     """
     if not text:
         return ""
 
     text = str(text)
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    text = text.replace('"', '&quot;')
-    text = text.replace("'", '&apos;')
+    if len(text) <= _XML_PRESCAN_MAX and _XML_ESCAPE_RE.search(text) is None:
+        return text
+
+    return text.translate(XML_ESCAPE_TABLE)
+
+
+def strip_invalid_xml_chars(text: str) -> str:
+    """Remove control characters that are invalid in XML (no escaping)."""
+    return _XML_INVALID_RE.sub('', text)
+
+
+def _is_missing(val: Any) -> bool:
+    """
+    True for None and pandas' missing values (NaN, NA, NaT).
 
-    # Remove control characters that are invalid in XML
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    Strings, ints and floats are checked directly; only other types go
+    through pd.isna, whose dispatch dominates these converters.
+    """
+    if val is None:
+        return True
+    if isinstance(val, (str, int)):
+        return False
+    if isinstance(val, float):
+        return val != val
+    if pd is None:
+        return False
 
-    return text
+    try:
+        return pd.isna(val)
+    except TypeError:
+        return False
 
 
 def safe_float(val: Any, default: float = 0.0) -> float:
@@ -80,15 +156,12 @@ def safe_float(val: Any, default: float = 0.0) -> float:
 
     Returns default if parsing fails or value is None/NaN.
     """
-    if val is None:
-        return default
+    # Already a float: only NaN needs handling
+    if val.__class__ is float:
+        return default if val != val else val
 
-    try:
-        import pandas as pd
-        if pd.isna(val):
-            return default
-    except (ImportError, TypeError):
-        pass
+    if _is_missing(val):
+        return default
 
     try:
         result = float(val)
@@ -102,15 +175,15 @@ def safe_float(val: Any, default: float = 0.0) -> float:
 
 def safe_int(val: Any, default: int = 0) -> int:
     """Safely parse a value to int."""
-    if val is None:
-        return default
+    # Plain ints and floats skip the missing check and float() round trip
+    # (an infinite float still raises OverflowError)
+    if val.__class__ is int:
+        return val
+    if val.__class__ is float:
+        return default if val != val else int(val)
 
-    try:
-        import pandas as pd
-        if pd.isna(val):
-            return default
-    except (ImportError, TypeError):
-        pass
+    if _is_missing(val):
+        return default
 
     try:
         return int(float(val))
@@ -120,16 +193,9 @@ def safe_int(val: Any, default: int = 0) -> int:
 
 def safe_str(val: Any, default: str = "") -> str:
     """Safely convert a value to string, handling None and NaN."""
-    if val is None:
+    if _is_missing(val):
         return default
 
-    try:
-        import pandas as pd
-        if pd.isna(val):
-            return default
-    except (ImportError, TypeError):
-        pass
-
     return str(val).strip()
 
 
@@ -142,63 +208,46 @@ def parse_boolean(val: Any) -> Optional[bool]:
         False for: 'no', 'false', '0', 'n', False
         None for: empty, None, other values
     """
-    if val is None:
+    if _is_missing(val):
         return None
 
-    try:
-        import pandas as pd
-        if pd.isna(val):
-            return None
-    except (ImportError, TypeError):
-        pass
-
     if isinstance(val, bool):
         return val
+    if isinstance(val, int):
+        # Same as looking up str(val), without building the string
+        return val == 1 if val in (0, 1) else None
 
-    val_str = str(val).lower().strip()
-
-    if val_str in ('yes', 'true', '1', 'y'):
-        return True
-    elif val_str in ('no', 'false', '0', 'n'):
-        return False
-    elif val_str == '':
-        return None
-
-    return None
+    return BOOLEAN_VALUES.get(str(val).lower().strip())
 
 
 def format_bytes(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if abs(size_bytes) < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    # Each unit is 10 more bits; dividing by a power of two is exact, so
+    # this matches repeated division by 1024
+    exponent = min((abs(int(size_bytes)).bit_length() - 1) // 10, 5)
+    if exponent <= 0:
+        return f"{size_bytes:.1f} B"
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {BYTE_UNITS[exponent]}"
 
 
 def get_timestamp() -> str:
     """Get current timestamp in ISO format."""
-    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
 
 
 def z_score(confidence_level: float) -> float:
     """
     Get Z-score for a given confidence level.
 
-    Common values:
+    Common values come from Z_SCORES (the level is rounded to 4 decimals
+    for the lookup), so scipy is only imported for unusual levels:
         0.90 -> 1.645
         0.95 -> 1.960
         0.99 -> 2.576
     """
-    z_scores = {
-        0.90: 1.645,
-        0.95: 1.960,
-        0.99: 2.576,
-        0.999: 3.291
-    }
-
-    if confidence_level in z_scores:
-        return z_scores[confidence_level]
+    z = Z_SCORES.get(round(confidence_level, 4))
+    if z is not None:
+        return z
 
     # For other values, use scipy if available
     try:
@@ -7,11 +7,20 @@ Performs quality checks and generates report.json with metrics.
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import mmap
+from typing import Dict, Iterable, List, Any, Optional
 from collections import Counter
+from itertools import compress
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import Config
-from .graph import GraphBuilder
+from .graph import GraphBuilder, REL_REQUIRES_SKILL
 from .normalizer import SkillNormalizer
 from .parser import DataParser
 from .utils import get_timestamp, format_bytes
@@ -19,6 +28,58 @@ from .utils import get_timestamp, format_bytes
 
 logger = logging.getLogger('graph_builder')
 
+# Bytes compared per numpy pass when counting output CSV lines
+LINE_COUNT_BLOCK = 1 << 22
+
+_LF = ord('\n')
+_CR = ord('\r')
+
+
+def _count_lines(path: str) -> int:
+    """
+    Count a file's lines without decoding it.
+
+    Counts like text-mode iteration: LF, CRLF and a lone CR each end a
+    line, and an unterminated last line counts too. The file is
+    memory-mapped and scanned with numpy, one block at a time.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        has_cr = mm.find(b'\r') != -1
+        data = block = None
+        try:
+            data = np.frombuffer(mm, dtype=np.uint8)
+
+            lines = 0
+            # Lone CRs end lines too; a CRLF is counted once, by its LF.
+            # A CRLF may straddle two blocks, so the last CR is carried over.
+            crs = crlfs = 0
+            prev_is_cr = False
+            for start in range(0, size, LINE_COUNT_BLOCK):
+                block = data[start:start + LINE_COUNT_BLOCK]
+                is_lf = block == _LF
+                lines += int(np.count_nonzero(is_lf))
+
+                if has_cr:
+                    is_cr = block == _CR
+                    crs += int(np.count_nonzero(is_cr))
+                    crlfs += int(np.count_nonzero(is_cr[:-1] & is_lf[1:]))
+                    crlfs += prev_is_cr and bool(is_lf[0])
+                    prev_is_cr = bool(is_cr[-1])
+            lines += crs - crlfs
+
+            last = data[-1]
+            if last != _LF and last != _CR:
+                lines += 1
+        finally:
+            # The arrays must be gone before the map can close
+            del data, block
+
+    return lines
+
 
 class Validator:
     """Validate graph quality and generate reports."""
@@ -34,7 +95,8 @@ class Validator:
         normalizer: SkillNormalizer,
         parser: DataParser,
         output_files: Dict[str, str],
-        sampling_report: Optional[Dict] = None
+        sampling_report: Optional[Dict] = None,
+        row_counts: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         Validate the graph and generate a comprehensive report.
@@ -45,6 +107,8 @@ class Validator:
             parser: Data parser
             output_files: Dict of output file paths
             sampling_report: Optional sampling report from sampler
+            row_counts: Optional data rows per CSV output, as counted by
+                the exporter; other CSVs are counted from disk
 
         Returns:
             Complete report dict
@@ -59,7 +123,7 @@ class Validator:
             'normalization': normalizer.get_stats(),
             'graph': graph.get_stats(),
             'quality': self._check_quality(graph, parser),
-            'output_files': self._get_output_stats(output_files),
+            'output_files': self._get_output_stats(output_files, row_counts or {}),
             'sampling': sampling_report,
             'warnings': self.warnings,
             'errors': self.errors
@@ -74,8 +138,19 @@ class Validator:
         """Write report to JSON file."""
         path = os.path.join(self.config.output_dir, 'report.json')
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2), encoded in C. Non-ASCII
+            # text is written as UTF-8 instead of \u escapes.
+            data = orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=str)
 
         logger.info(f"Report written to {path}")
         return path
@@ -104,34 +179,35 @@ class Validator:
         parser: DataParser
     ) -> Dict[str, Any]:
         """Check graph quality metrics."""
-        jobs = [n for n in graph.nodes.values() if n['kind'] == 'job']
-        skills = [n for n in graph.nodes.values() if n['kind'] == 'skill']
+        # Job nodes go to the coverage check as a generator, so no list
+        # of them is built; the graph keeps the job count
+        n_jobs = graph.n_jobs
+        jobs = (n for n in graph.nodes.values() if n['kind'] == 'job')
 
         # Jobs with skills
         jobs_with_skills_pct = (
-            len(graph.jobs_with_skills) / len(jobs) * 100
-            if jobs else 0
+            len(graph.jobs_with_skills) / n_jobs * 100
+            if n_jobs else 0
         )
 
         # Jobs with category
         jobs_with_category_pct = (
-            len(graph.jobs_with_category) / len(jobs) * 100
-            if jobs else 0
+            len(graph.jobs_with_category) / n_jobs * 100
+            if n_jobs else 0
         )
 
+        # Skill edges per target skill, in one pass over the edges
+        is_skill_edge = [rel == REL_REQUIRES_SKILL for rel in graph.edge_rel]
+        skill_edge_counts = Counter(compress(graph.edge_target, is_skill_edge))
+
         # Average skills per job
-        skill_edges = [e for e in graph.edges if e['rel'] == 'REQUIRES_SKILL']
-        avg_skills = len(skill_edges) / len(jobs) if jobs else 0
+        skill_edges = sum(skill_edge_counts.values())
+        avg_skills = skill_edges / n_jobs if n_jobs else 0
 
         # Metadata coverage
-        coverage = self._check_metadata_coverage(jobs)
+        coverage = self._check_metadata_coverage(jobs, n_jobs)
 
         # Top skills
-        skill_edge_counts = Counter()
-        for edge in graph.edges:
-            if edge['rel'] == 'REQUIRES_SKILL':
-                skill_edge_counts[edge['target']] += 1
-
         top_skills = []
         for skill_id, count in skill_edge_counts.most_common(10):
             if skill_id in graph.nodes:
@@ -149,9 +225,9 @@ class Validator:
             'top_skills': top_skills
         }
 
-    def _check_metadata_coverage(self, jobs: List[Dict]) -> Dict[str, float]:
-        """Check coverage of metadata fields in job nodes."""
-        if not jobs:
+    def _check_metadata_coverage(self, jobs: Iterable[Dict], n_jobs: int) -> Dict[str, float]:
+        """Check coverage of metadata fields in the n_jobs job nodes."""
+        if not n_jobs:
             return {}
 
         fields = [
@@ -160,17 +236,25 @@ class Validator:
             'work_from_home', 'assigned_occupation_group'
         ]
 
+        # One pass over the jobs, keeping a non-empty count per field
+        non_empty = [0] * len(fields)
+        for job in jobs:
+            for i, field in enumerate(fields):
+                value = job.get(field)
+                if value and str(value).strip() and value != 0:
+                    non_empty[i] += 1
+
         coverage = {}
-        for field in fields:
-            non_empty = sum(
-                1 for j in jobs
-                if j.get(field) and str(j.get(field)).strip() and j.get(field) != 0
-            )
-            coverage[field] = round(non_empty / len(jobs) * 100, 1)
+        for field, count in zip(fields, non_empty):
+            coverage[field] = round(count / n_jobs * 100, 1)
 
         return coverage
 
-    def _get_output_stats(self, output_files: Dict[str, str]) -> Dict[str, Dict]:
+    def _get_output_stats(
+        self,
+        output_files: Dict[str, str],
+        row_counts: Dict[str, int]
+    ) -> Dict[str, Dict]:
         """Get statistics for output files."""
         stats = {}
 
@@ -183,13 +267,15 @@ class Validator:
                     'size_human': format_bytes(size)
                 }
 
-                # Count rows for CSV files
-                if path.endswith('.csv'):
+                # Rows counted by the writer (compressed CSVs included);
+                # other plain CSV files are counted from disk
+                if name in row_counts:
+                    stats[name]['rows'] = row_counts[name]
+                elif path.endswith('.csv'):
                     try:
-                        with open(path, 'r') as f:
-                            # Count lines (minus header)
-                            row_count = sum(1 for _ in f) - 1
-                            stats[name]['rows'] = max(0, row_count)
+                        # Count lines (minus header)
+                        row_count = _count_lines(path) - 1
+                        stats[name]['rows'] = max(0, row_count)
                     except Exception:
                         pass
             else:
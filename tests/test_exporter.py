@@ -0,0 +1,33 @@
+"""
+Tests for GraphML value formatting in the exporter.
+"""
+
+import unittest
+
+from graph_builder.exporter import _format_double, _format_int
+
+
+class TestGraphmlNumberFormatting(unittest.TestCase):
+
+    def test_int_beyond_64_bits(self):
+        # token_count "1e20" parses to 10**20, outside orjson's range
+        self.assertEqual(_format_int(10 ** 20), b'100000000000000000000')
+        self.assertEqual(_format_int(-2 ** 70), str(-2 ** 70).encode('ascii'))
+
+    def test_int_within_64_bits(self):
+        self.assertEqual(_format_int(42), b'42')
+
+    def test_double_given_big_int(self):
+        self.assertEqual(_format_double(10 ** 20), b'100000000000000000000')
+
+    def test_double_non_finite(self):
+        self.assertEqual(_format_double(float('inf')), b'inf')
+        self.assertEqual(_format_double(float('-inf')), b'-inf')
+        self.assertEqual(_format_double(float('nan')), b'nan')
+
+    def test_double_rounding(self):
+        self.assertEqual(_format_double(0.123456), b'0.1235')
+
+
+if __name__ == '__main__':
+    unittest.main()
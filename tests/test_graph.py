@@ -0,0 +1,64 @@
+"""
+Tests for resolving skill IDs while rows stream into the graph builder.
+"""
+
+import unittest
+
+from graph_builder.config import Config
+from graph_builder.graph import GraphBuilder
+from graph_builder.normalizer import SkillNormalizer
+from graph_builder.parser import JobRow
+
+
+def _row(job_id, skills):
+    return JobRow(
+        job_id, 'Title', 'Company', '', '', '', '', '', 'Group', 'Group', '',
+        0, '', 0.0, 0.0, '', '',
+        [{'skill': s, 'bucket': 'core', 'mapping_similarity': 0.9} for s in skills],
+        0,
+    )
+
+
+def _build(rows, streamed):
+    normalizer = SkillNormalizer()
+    if streamed:
+        rows = normalizer.process_all(rows)
+    else:
+        rows = list(normalizer.process_all(rows))
+    return GraphBuilder(Config()).build(rows, normalizer)
+
+
+def _edges(graph):
+    return list(zip(graph.edge_source, graph.edge_target, graph.edge_rel))
+
+
+class TestStreamedSkillResolution(unittest.TestCase):
+
+    def test_rejected_label_matches_later_skill(self):
+        # 'C' is too short to register, but its slug matches the key
+        # 'c#' registers in a later row
+        rows = [
+            _row('1', ['Python', 'C']),
+            _row('2', ['Java']),
+            _row('3', ['C#']),
+        ]
+
+        streamed = _build(rows, streamed=True)
+        listed = _build(rows, streamed=False)
+
+        self.assertIn(('job:1', 'skill:c', 0), _edges(streamed))
+        self.assertEqual(_edges(streamed), _edges(listed))
+        self.assertEqual(streamed.skill_edges_created, listed.skill_edges_created)
+        self.assertEqual(streamed.jobs_with_skills, listed.jobs_with_skills)
+
+    def test_rejected_label_without_match(self):
+        rows = [_row('1', ['Python', 'C']), _row('2', ['Java'])]
+
+        streamed = _build(rows, streamed=True)
+
+        self.assertNotIn('skill:c', streamed.edge_target)
+        self.assertEqual(_edges(streamed), _edges(_build(rows, streamed=False)))
+
+
+if __name__ == '__main__':
+    unittest.main()